@@ -7,153 +7,210 @@ and provides type-safe access to application settings.
 
 import os
 import logging
-from typing import List, Set, Optional, Dict, Any, Union
+import functools
+import numpy as np
+from dataclasses import dataclass, field, asdict
+from typing import List, FrozenSet, Optional, Dict, Any, Union, Callable
 from pathlib import Path
-from pydantic import Field, validator
-from pydantic_settings import BaseSettings
-from enum import Enum
 
 logger = logging.getLogger(__name__)
 
+_rng = np.random.default_rng()
 
-class LogLevel(str, Enum):
-    """Logging levels enum"""
-    CRITICAL = "CRITICAL"
-    ERROR = "ERROR"
-    WARNING = "WARNING"
-    INFO = "INFO"
-    DEBUG = "DEBUG"
+# Allowed values for choice-constrained settings. Plain frozensets keep
+# membership checks to a single hash probe (no Enum construction, no regex).
+LOG_LEVELS = frozenset({'CRITICAL', 'ERROR', 'WARNING', 'INFO', 'DEBUG'})
 
+# Supported AWS regions for S3 Vectors
+AWS_REGIONS = frozenset({'us-east-1', 'us-east-2', 'us-west-2', 'ap-southeast-2', 'eu-central-1'})
 
-class AWSRegion(str, Enum):
-    """Supported AWS regions for S3 Vectors"""
-    US_EAST_1 = "us-east-1"
-    US_EAST_2 = "us-east-2"
-    US_WEST_2 = "us-west-2"
-    AP_SOUTHEAST_2 = "ap-southeast-2"
-    EU_CENTRAL_1 = "eu-central-1"
+# Supported embedding models
+EMBEDDING_MODELS = frozenset({'all-MiniLM-L6-v2', 'all-mpnet-base-v2', 'paraphrase-MiniLM-L3-v2',
+                              'clip-ViT-B-32'})
 
+# Supported sentence-transformers inference backends
+EMBEDDING_BACKENDS = frozenset({'torch', 'onnx', 'openvino'})
 
-class EmbeddingModel(str, Enum):
-    """Supported embedding models"""
-    ALL_MINILM_L6_V2 = "all-MiniLM-L6-v2"
-    ALL_MPNET_BASE_V2 = "all-mpnet-base-v2"
-    PARAPHRASE_MINILM_L3_V2 = "paraphrase-MiniLM-L3-v2"
+TRUNCATION_STRATEGIES = frozenset({'start', 'end', 'middle'})
 
+IMAGE_FORMATS = frozenset({'JPEG', 'PNG', 'RGB'})
 
-class ServerConfig(BaseSettings):
+
+def _load_dotenv(path: str) -> None:
+    """
+    Minimal .env loader (KEY=VALUE lines, '#' comments, optional quotes).
+
+    Avoids importing python-dotenv on the server cold path; existing
+    environment variables always win.
+    """
+    with open(path, encoding='utf-8') as env_file:
+        for line in env_file:
+            line = line.strip()
+            if not line or line.startswith('#') or '=' not in line:
+                continue
+            key, _, value = line.partition('=')
+            os.environ.setdefault(key.strip(), value.strip().strip('"').strip("'"))
+
+
+def _as_bool(value: str) -> bool:
+    """Parse a boolean environment variable value"""
+    return value.strip().lower() in ('1', 'true', 'yes', 'on')
+
+
+def _env(name: str, default: Any, cast: Callable[[str], Any] = str) -> Any:
+    """Read an environment variable, applying `cast` when it is set"""
+    value = os.environ.get(name)
+    if value is None:
+        value = os.environ.get(name.lower())
+    return cast(value) if value is not None else default
+
+
+def _check_range(name: str, value: Union[int, float],
+                 minimum: Union[int, float], maximum: Union[int, float]) -> None:
+    """Validate that a numeric config value is within its allowed range"""
+    if not minimum <= value <= maximum:
+        raise ValueError(f"{name} must be between {minimum} and {maximum}, got {value}")
+
+
+def _check_choice(name: str, value: str, choices: frozenset) -> None:
+    """Validate that a string config value is one of the allowed choices"""
+    if value not in choices:
+        raise ValueError(f"{name} must be one of {sorted(choices)}, got {value!r}")
+
+
+@dataclass(slots=True, frozen=True)
+class ServerConfig:
     """Server configuration settings"""
-    
+
     # Server settings
-    host: str = Field(default="0.0.0.0", description="Server host address")
-    port: int = Field(default=8000, ge=1, le=65535, description="Server port")
-    debug: bool = Field(default=False, description="Debug mode")
-    log_level: LogLevel = Field(default=LogLevel.INFO, description="Logging level")
-    
+    host: str = field(default_factory=lambda: _env('HOST', '0.0.0.0'))
+    port: int = field(default_factory=lambda: _env('PORT', 8000, int))
+    debug: bool = field(default_factory=lambda: _env('DEBUG', False, _as_bool))
+    log_level: str = field(default_factory=lambda: _env('LOG_LEVEL', 'INFO'))
+
     # API settings
-    api_title: str = Field(default="S3 Vector Service", description="API title")
-    api_version: str = Field(default="1.0.0", description="API version")
-    docs_url: str = Field(default="/docs", description="API documentation URL")
-    redoc_url: str = Field(default="/redoc", description="ReDoc documentation URL")
-    
-    class Config:
-        env_prefix = ""
-        case_sensitive = False
+    api_title: str = field(default_factory=lambda: _env('API_TITLE', 'S3 Vector Service'))
+    api_version: str = field(default_factory=lambda: _env('API_VERSION', '1.0.0'))
+    docs_url: str = field(default_factory=lambda: _env('DOCS_URL', '/docs'))
+    redoc_url: str = field(default_factory=lambda: _env('REDOC_URL', '/redoc'))
+
+    def __post_init__(self):
+        _check_range('port', self.port, 1, 65535)
+        _check_choice('log_level', self.log_level, LOG_LEVELS)
 
 
-class AWSConfig(BaseSettings):
+@dataclass(slots=True, frozen=True)
+class AWSConfig:
     """AWS configuration settings"""
-    
+
     # AWS credentials
-    aws_access_key_id: Optional[str] = Field(default=None, description="AWS Access Key ID")
-    aws_secret_access_key: Optional[str] = Field(default=None, description="AWS Secret Access Key")
-    aws_region: AWSRegion = Field(default=AWSRegion.US_EAST_1, description="AWS region")
-    aws_profile: Optional[str] = Field(default=None, description="AWS profile name")
-    
+    aws_access_key_id: Optional[str] = field(default_factory=lambda: _env('AWS_ACCESS_KEY_ID', None))
+    aws_secret_access_key: Optional[str] = field(default_factory=lambda: _env('AWS_SECRET_ACCESS_KEY', None))
+    aws_region: str = field(default_factory=lambda: _env('AWS_REGION', 'us-east-1'))
+    aws_profile: Optional[str] = field(default_factory=lambda: _env('AWS_PROFILE', None))
+
     # S3 Vector settings
-    s3_vector_bucket_name: str = Field(..., description="S3 Vector bucket name")
-    s3_vector_index_name: str = Field(default="default-index", description="Vector index name")
-    s3_bucket_region: Optional[AWSRegion] = Field(default=None, description="S3 bucket region override")
-    
-    @validator('s3_bucket_region', pre=True, always=True)
-    def set_bucket_region(cls, v, values):
-        """Set bucket region to AWS region if not specified"""
-        return v or values.get('aws_region')
-    
-    class Config:
-        env_prefix = ""
-        case_sensitive = False
-
-
-class VectorConfig(BaseSettings):
+    s3_vector_bucket_name: Optional[str] = field(default_factory=lambda: _env('S3_VECTOR_BUCKET_NAME', None))
+    s3_vector_index_name: str = field(default_factory=lambda: _env('S3_VECTOR_INDEX_NAME', 'default-index'))
+    s3_bucket_region: Optional[str] = field(default_factory=lambda: _env('S3_BUCKET_REGION', None))
+
+    def __post_init__(self):
+        _check_choice('aws_region', self.aws_region, AWS_REGIONS)
+        # Default bucket region to the AWS region if not specified
+        if self.s3_bucket_region is None:
+            object.__setattr__(self, 's3_bucket_region', self.aws_region)
+        else:
+            _check_choice('s3_bucket_region', self.s3_bucket_region, AWS_REGIONS)
+
+
+@dataclass(slots=True, frozen=True)
+class VectorConfig:
     """Vector processing configuration"""
-    
+
     # Vector settings
-    vector_dimension: int = Field(default=768, ge=1, le=4096, description="Vector embedding dimension")
-    embedding_model: EmbeddingModel = Field(default=EmbeddingModel.ALL_MPNET_BASE_V2, description="Embedding model")
-    
+    vector_dimension: int = field(default_factory=lambda: _env('VECTOR_DIMENSION', 768, int))
+    embedding_model: str = field(default_factory=lambda: _env('EMBEDDING_MODEL', 'all-mpnet-base-v2'))
+    embedding_backend: str = field(default_factory=lambda: _env('EMBEDDING_BACKEND', 'torch'))
+    encode_batch_size: int = field(default_factory=lambda: _env('ENCODE_BATCH_SIZE', 32, int))
+    embedding_cache_size: int = field(default_factory=lambda: _env('EMBEDDING_CACHE_SIZE', 1000, int))
+
     # Text processing
-    max_text_length: int = Field(default=512, ge=1, le=8192, description="Maximum text length for processing")
-    text_truncation_strategy: str = Field(default="end", pattern="^(start|end|middle)$", description="Text truncation strategy")
-    
+    max_text_length: int = field(default_factory=lambda: _env('MAX_TEXT_LENGTH', 512, int))
+    text_truncation_strategy: str = field(default_factory=lambda: _env('TEXT_TRUNCATION_STRATEGY', 'end'))
+
     # Image processing
-    image_resize_width: int = Field(default=224, ge=32, le=1024, description="Image resize width")
-    image_resize_height: int = Field(default=224, ge=32, le=1024, description="Image resize height")
-    image_format: str = Field(default="JPEG", pattern="^(JPEG|PNG|RGB)$", description="Image processing format")
-    
+    image_resize_width: int = field(default_factory=lambda: _env('IMAGE_RESIZE_WIDTH', 224, int))
+    image_resize_height: int = field(default_factory=lambda: _env('IMAGE_RESIZE_HEIGHT', 224, int))
+    image_format: str = field(default_factory=lambda: _env('IMAGE_FORMAT', 'JPEG'))
+
     # Query defaults (AWS S3 Vectors limits: topK must be 1-30)
-    default_top_k: int = Field(default=10, ge=1, le=30, description="Default number of results to return")
-    max_top_k: int = Field(default=30, ge=1, le=30, description="Maximum number of results allowed (AWS S3 Vectors limit)")
-    default_similarity_threshold: float = Field(default=0.0, ge=0.0, le=1.0, description="Default similarity threshold")
-    
+    default_top_k: int = field(default_factory=lambda: _env('DEFAULT_TOP_K', 10, int))
+    max_top_k: int = field(default_factory=lambda: _env('MAX_TOP_K', 30, int))
+    default_similarity_threshold: float = field(default_factory=lambda: _env('DEFAULT_SIMILARITY_THRESHOLD', 0.0, float))
+
     # API limits (AWS S3 Vectors limits: topK must be 1-30)
-    max_list_limit: int = Field(default=30, ge=1, le=30, description="Maximum list API limit (AWS S3 Vectors limit)")
-    default_list_limit: int = Field(default=10, ge=1, le=30, description="Default list limit")
-    
-    class Config:
-        env_prefix = ""
-        case_sensitive = False
+    max_list_limit: int = field(default_factory=lambda: _env('MAX_LIST_LIMIT', 30, int))
+    default_list_limit: int = field(default_factory=lambda: _env('DEFAULT_LIST_LIMIT', 10, int))
 
+    def __post_init__(self):
+        _check_range('vector_dimension', self.vector_dimension, 1, 4096)
+        _check_choice('embedding_model', self.embedding_model, EMBEDDING_MODELS)
+        _check_choice('embedding_backend', self.embedding_backend, EMBEDDING_BACKENDS)
+        _check_range('encode_batch_size', self.encode_batch_size, 1, 1024)
+        _check_range('embedding_cache_size', self.embedding_cache_size, 0, 100000)
+        _check_range('max_text_length', self.max_text_length, 1, 8192)
+        _check_choice('text_truncation_strategy', self.text_truncation_strategy, TRUNCATION_STRATEGIES)
+        _check_range('image_resize_width', self.image_resize_width, 32, 1024)
+        _check_range('image_resize_height', self.image_resize_height, 32, 1024)
+        _check_choice('image_format', self.image_format, IMAGE_FORMATS)
+        _check_range('default_top_k', self.default_top_k, 1, 30)
+        _check_range('max_top_k', self.max_top_k, 1, 30)
+        _check_range('default_similarity_threshold', self.default_similarity_threshold, 0.0, 1.0)
+        _check_range('max_list_limit', self.max_list_limit, 1, 30)
+        _check_range('default_list_limit', self.default_list_limit, 1, 30)
 
-class FileValidationConfig(BaseSettings):
+
+@dataclass(slots=True, frozen=True)
+class FileValidationConfig:
     """File validation configuration"""
-    
+
     # Size limits (in MB)
-    max_file_size_mb: int = Field(default=50, ge=1, le=1000, description="Maximum file size in MB")
-    max_batch_size_mb: int = Field(default=200, ge=1, le=5000, description="Maximum batch size in MB")
-    
+    max_file_size_mb: int = field(default_factory=lambda: _env('MAX_FILE_SIZE_MB', 50, int))
+    max_batch_size_mb: int = field(default_factory=lambda: _env('MAX_BATCH_SIZE_MB', 200, int))
+
     # File types
-    allowed_file_types: str = Field(
-        default="text/*,application/pdf,image/*",
-        description="Comma-separated list of allowed MIME types"
-    )
-    blocked_file_extensions: str = Field(
-        default=".exe,.bat,.cmd,.scr,.com,.pif,.dll,.sys",
-        description="Comma-separated list of blocked file extensions"
-    )
-    
+    allowed_file_types: str = field(default_factory=lambda: _env(
+        'ALLOWED_FILE_TYPES', 'text/*,application/pdf,image/*'))
+    blocked_file_extensions: str = field(default_factory=lambda: _env(
+        'BLOCKED_FILE_EXTENSIONS', '.exe,.bat,.cmd,.scr,.com,.pif,.dll,.sys'))
+
     # Processing
-    allow_empty_files: bool = Field(default=False, description="Allow empty files")
-    strict_mime_type_checking: bool = Field(default=True, description="Strict MIME type validation")
-    
-    @property
-    def max_file_size_bytes(self) -> int:
-        """Get max file size in bytes"""
-        return self.max_file_size_mb * 1024 * 1024
-    
-    @property
-    def max_batch_size_bytes(self) -> int:
-        """Get max batch size in bytes"""
-        return self.max_batch_size_mb * 1024 * 1024
-    
-    @property
-    def allowed_mime_types_set(self) -> Set[str]:
-        """Get allowed MIME types as a set"""
-        return {mime_type.strip().lower() for mime_type in self.allowed_file_types.split(',') if mime_type.strip()}
-    
-    @property
-    def blocked_extensions_set(self) -> Set[str]:
-        """Get blocked extensions as a set"""
+    allow_empty_files: bool = field(default_factory=lambda: _env('ALLOW_EMPTY_FILES', False, _as_bool))
+    strict_mime_type_checking: bool = field(default_factory=lambda: _env('STRICT_MIME_TYPE_CHECKING', True, _as_bool))
+
+    # Derived values, computed once in __post_init__ (the config is immutable,
+    # so these would otherwise be rebuilt on every hot-path access)
+    max_file_size_bytes: int = field(init=False)
+    max_batch_size_bytes: int = field(init=False)
+    allowed_mime_types_set: FrozenSet[str] = field(init=False)
+    blocked_extensions_set: FrozenSet[str] = field(init=False)
+
+    def __post_init__(self):
+        _check_range('max_file_size_mb', self.max_file_size_mb, 1, 1000)
+        _check_range('max_batch_size_mb', self.max_batch_size_mb, 1, 5000)
+        object.__setattr__(self, 'max_file_size_bytes', self.max_file_size_mb * 1024 * 1024)
+        object.__setattr__(self, 'max_batch_size_bytes', self.max_batch_size_mb * 1024 * 1024)
+        object.__setattr__(self, 'allowed_mime_types_set', self._parse_allowed_types())
+        object.__setattr__(self, 'blocked_extensions_set', self._parse_blocked_extensions())
+
+    def _parse_allowed_types(self) -> FrozenSet[str]:
+        """Parse allowed MIME types into an immutable set"""
+        return frozenset(
+            mime_type.strip().lower() for mime_type in self.allowed_file_types.split(',') if mime_type.strip()
+        )
+
+    def _parse_blocked_extensions(self) -> FrozenSet[str]:
+        """Parse blocked extensions into an immutable set"""
         extensions = set()
         for ext in self.blocked_file_extensions.split(','):
             ext = ext.strip().lower()
@@ -161,151 +218,170 @@ class FileValidationConfig(BaseSettings):
                 ext = '.' + ext
             if ext:
                 extensions.add(ext)
-        return extensions
-    
-    class Config:
-        env_prefix = ""
-        case_sensitive = False
+        return frozenset(extensions)
 
 
-class PerformanceConfig(BaseSettings):
+@dataclass(slots=True, frozen=True)
+class PerformanceConfig:
     """Performance and optimization configuration"""
-    
+
     # Timeouts (in seconds)
-    request_timeout: int = Field(default=30, ge=1, le=300, description="Request timeout in seconds")
-    upload_timeout: int = Field(default=300, ge=1, le=3600, description="Upload timeout in seconds")
-    query_timeout: int = Field(default=60, ge=1, le=300, description="Query timeout in seconds")
-    
+    request_timeout: int = field(default_factory=lambda: _env('REQUEST_TIMEOUT', 30, int))
+    upload_timeout: int = field(default_factory=lambda: _env('UPLOAD_TIMEOUT', 300, int))
+    query_timeout: int = field(default_factory=lambda: _env('QUERY_TIMEOUT', 60, int))
+
     # Concurrency
-    max_concurrent_uploads: int = Field(default=10, ge=1, le=100, description="Maximum concurrent uploads")
-    max_concurrent_queries: int = Field(default=50, ge=1, le=500, description="Maximum concurrent queries")
-    
+    max_concurrent_uploads: int = field(default_factory=lambda: _env('MAX_CONCURRENT_UPLOADS', 10, int))
+    max_concurrent_queries: int = field(default_factory=lambda: _env('MAX_CONCURRENT_QUERIES', 50, int))
+
     # Caching
-    enable_embedding_cache: bool = Field(default=False, description="Enable embedding caching")
-    cache_ttl_seconds: int = Field(default=3600, ge=60, le=86400, description="Cache TTL in seconds")
-    max_cache_size: int = Field(default=1000, ge=10, le=10000, description="Maximum cache entries")
-    
+    enable_embedding_cache: bool = field(default_factory=lambda: _env('ENABLE_EMBEDDING_CACHE', False, _as_bool))
+    cache_ttl_seconds: int = field(default_factory=lambda: _env('CACHE_TTL_SECONDS', 3600, int))
+    max_cache_size: int = field(default_factory=lambda: _env('MAX_CACHE_SIZE', 1000, int))
+
     # Retry settings
-    max_retries: int = Field(default=3, ge=0, le=10, description="Maximum retry attempts")
-    retry_delay_seconds: float = Field(default=1.0, ge=0.1, le=60.0, description="Retry delay in seconds")
-    exponential_backoff: bool = Field(default=True, description="Use exponential backoff for retries")
-    
-    class Config:
-        env_prefix = ""
-        case_sensitive = False
+    max_retries: int = field(default_factory=lambda: _env('MAX_RETRIES', 3, int))
+    retry_delay_seconds: float = field(default_factory=lambda: _env('RETRY_DELAY_SECONDS', 1.0, float))
+    exponential_backoff: bool = field(default_factory=lambda: _env('EXPONENTIAL_BACKOFF', True, _as_bool))
+
+    def __post_init__(self):
+        _check_range('request_timeout', self.request_timeout, 1, 300)
+        _check_range('upload_timeout', self.upload_timeout, 1, 3600)
+        _check_range('query_timeout', self.query_timeout, 1, 300)
+        _check_range('max_concurrent_uploads', self.max_concurrent_uploads, 1, 100)
+        _check_range('max_concurrent_queries', self.max_concurrent_queries, 1, 500)
+        _check_range('cache_ttl_seconds', self.cache_ttl_seconds, 60, 86400)
+        _check_range('max_cache_size', self.max_cache_size, 10, 10000)
+        _check_range('max_retries', self.max_retries, 0, 10)
+        _check_range('retry_delay_seconds', self.retry_delay_seconds, 0.1, 60.0)
 
 
 class S3VectorConfig:
     """Main configuration class that combines all configuration sections"""
-    
+
     def __init__(self, env_file: Optional[str] = None):
         """Initialize configuration from environment variables and optional .env file"""
         self._load_environment(env_file)
-        
+
         # Initialize configuration sections
         self.server = ServerConfig()
         self.aws = AWSConfig()
         self.vector = VectorConfig()
         self.file_validation = FileValidationConfig()
         self.performance = PerformanceConfig()
-        
+
+        # Lazily-computed dummy vector reused by health checks
+        self._dummy_vector: Optional[List[float]] = None
+
+        # Lazily-computed validation warnings
+        self._config_warnings: Optional[List[str]] = None
+
         # Log configuration summary
         self._log_config_summary()
-    
+
     def _load_environment(self, env_file: Optional[str] = None):
         """Load environment variables from .env file if available"""
         if env_file and Path(env_file).exists():
-            from dotenv import load_dotenv
-            load_dotenv(env_file)
+            _load_dotenv(env_file)
             logger.info(f"Loaded environment from {env_file}")
         elif Path(".env").exists():
-            from dotenv import load_dotenv
-            load_dotenv()
+            _load_dotenv(".env")
             logger.info("Loaded environment from .env")
-    
+
     def _log_config_summary(self):
         """Log configuration summary (without sensitive data)"""
+        if not logger.isEnabledFor(logging.INFO):
+            return
         logger.info("Configuration loaded:")
-        logger.info(f"  Server: {self.server.host}:{self.server.port} (debug={self.server.debug})")
-        logger.info(f"  AWS Region: {self.aws.aws_region}")
-        logger.info(f"  Vector Model: {self.vector.embedding_model} (dim={self.vector.vector_dimension})")
-        logger.info(f"  File Limits: {self.file_validation.max_file_size_mb}MB individual, {self.file_validation.max_batch_size_mb}MB batch")
-        logger.info(f"  Performance: {self.performance.max_concurrent_uploads} uploads, {self.performance.max_concurrent_queries} queries")
-    
+        logger.info("  Server: %s:%d (debug=%s)", self.server.host, self.server.port, self.server.debug)
+        logger.info("  AWS Region: %s", self.aws.aws_region)
+        logger.info("  Vector Model: %s (dim=%d)", self.vector.embedding_model, self.vector.vector_dimension)
+        logger.info("  File Limits: %dMB individual, %dMB batch",
+                    self.file_validation.max_file_size_mb, self.file_validation.max_batch_size_mb)
+        logger.info("  Performance: %d uploads, %d queries",
+                    self.performance.max_concurrent_uploads, self.performance.max_concurrent_queries)
+
     def get_dummy_vector(self) -> List[float]:
         """Get a dummy vector with the configured dimension for health checks"""
-        import random
-        # Generate a normalized random vector instead of zeros
-        # This is more likely to be accepted by S3 Vectors index
-        vector = [random.gauss(0, 0.1) for _ in range(self.vector.vector_dimension)]
-        # Normalize the vector
-        magnitude = sum(x*x for x in vector) ** 0.5
-        if magnitude > 0:
-            vector = [x/magnitude for x in vector]
-        return vector
-    
+        if self._dummy_vector is None:
+            # Generate a normalized random vector instead of zeros
+            # This is more likely to be accepted by S3 Vectors index
+            vector = _rng.standard_normal(self.vector.vector_dimension).astype(np.float32)
+            magnitude = float(np.linalg.norm(vector))
+            if magnitude > 0:
+                vector /= magnitude
+            self._dummy_vector = vector.tolist()
+        return self._dummy_vector
+
     def validate_configuration(self) -> List[str]:
         """Validate configuration and return list of warnings/errors"""
+        if self._config_warnings is not None:
+            return self._config_warnings
+
         warnings = []
-        
+
         # Check required AWS settings
         if not self.aws.s3_vector_bucket_name:
             warnings.append("S3_VECTOR_BUCKET_NAME is required")
-        
+
         # Check if AWS credentials are available
         if not self.aws.aws_access_key_id and not self.aws.aws_profile and not os.getenv('AWS_CONTAINER_CREDENTIALS_RELATIVE_URI'):
             warnings.append("No AWS credentials found (keys, profile, or container role)")
-        
+
         # Check vector dimension consistency
         if self.vector.vector_dimension not in [384, 512, 768, 1024]:
             warnings.append(f"Unusual vector dimension: {self.vector.vector_dimension}")
-        
+
         # Check file size limits
         if self.file_validation.max_file_size_mb > self.file_validation.max_batch_size_mb:
             warnings.append("Individual file size limit exceeds batch size limit")
-        
+
+        self._config_warnings = warnings
         return warnings
-    
+
     def to_dict(self) -> Dict[str, Any]:
         """Export configuration as dictionary (excluding sensitive data)"""
+        aws = asdict(self.aws)
+        aws.pop('aws_access_key_id', None)
+        aws.pop('aws_secret_access_key', None)
         return {
-            'server': self.server.dict(exclude={'aws_access_key_id', 'aws_secret_access_key'}),
-            'aws': self.aws.dict(exclude={'aws_access_key_id', 'aws_secret_access_key'}),
-            'vector': self.vector.dict(),
-            'file_validation': self.file_validation.dict(),
-            'performance': self.performance.dict()
+            'server': asdict(self.server),
+            'aws': aws,
+            'vector': asdict(self.vector),
+            'file_validation': asdict(self.file_validation),
+            'performance': asdict(self.performance)
         }
 
 
-# Global configuration instance
-_config: Optional[S3VectorConfig] = None
+@functools.lru_cache(maxsize=None)
+def _build_config(env_file: Optional[str]) -> S3VectorConfig:
+    """Build and validate a configuration instance (cached per env_file)"""
+    config = S3VectorConfig(env_file)
+
+    # Validate configuration (skipped entirely when warnings would be dropped)
+    if logger.isEnabledFor(logging.WARNING):
+        for warning in config.validate_configuration():
+            logger.warning("Configuration warning: %s", warning)
+
+    return config
 
 
 def get_config(env_file: Optional[str] = None, reload: bool = False) -> S3VectorConfig:
     """
     Get the global configuration instance.
-    
+
     Args:
         env_file: Optional path to .env file
         reload: Force reload of configuration
-        
+
     Returns:
         S3VectorConfig instance
     """
-    global _config
-    
-    if _config is None or reload:
-        _config = S3VectorConfig(env_file)
-        
-        # Validate configuration
-        warnings = _config.validate_configuration()
-        for warning in warnings:
-            logger.warning(f"Configuration warning: {warning}")
-    
-    return _config
+    if reload:
+        _build_config.cache_clear()
+    return _build_config(env_file)
 
 
 def reset_config():
     """Reset the global configuration (useful for testing)"""
-    global _config
-    _config = None 
\ No newline at end of file
+    _build_config.cache_clear()
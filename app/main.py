@@ -1,81 +1,205 @@
+import asyncio
+import base64
 import os
 import time
 import logging
 import tempfile
 import json
 from typing import List, Optional
-from fastapi import FastAPI, HTTPException, UploadFile, File, Form
-from fastapi.responses import JSONResponse
-
-from .models import (
-    FileUploadRequest, BatchUploadRequest, QueryRequest,
-    UploadResponse, BatchUploadResponse, QueryResponse,
-    FileResponse, ErrorResponse, HealthResponse
-)
-from .services.s3vector_service import S3VectorService
-from .services.file_validation_service import FileValidationError
-from .config import get_config
-
-# Initialize configuration
-config = get_config()
-
-# Configure logging
-logging.basicConfig(level=getattr(logging, config.server.log_level.value))
+
+# Skip pydantic core-schema validation during model builds (startup win)
+os.environ.setdefault("PYDANTIC_SKIP_VALIDATING_CORE_SCHEMAS", "true")
+
 logger = logging.getLogger(__name__)
 
-# Initialize FastAPI app with configuration
-app = FastAPI(
-    title=config.server.api_title,
-    description="A service for storing and querying files in AWS S3 Vector buckets",
-    version=config.server.api_version,
-    docs_url=config.server.docs_url,
-    redoc_url=config.server.redoc_url
-)
-
-# Initialize S3 Vector service
-s3vector_service = None
-
-
-@app.on_event("startup")
-async def startup_event():
-    """Initialize the S3 Vector service on startup"""
-    global s3vector_service
-    try:
-        s3vector_service = S3VectorService(config)
-        logger.info("S3 Vector service initialized successfully")
-    except Exception as e:
-        logger.error(f"Failed to initialize S3 Vector service: {e}")
-        raise
-
-
-@app.get("/validation-config")
-async def get_validation_config():
-    """Get current file validation configuration"""
-    try:
-        if s3vector_service is None:
+
+class _TTLCache:
+    """Small thread-safe LRU cache with per-entry expiry.
+
+    Used to memoize query-text embeddings; kept dependency-free (stdlib
+    OrderedDict) rather than pulling in cachetools for one structure.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        from collections import OrderedDict
+        from threading import Lock
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key):
+        now = time.monotonic()
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None and entry[1] > now:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            if entry is not None:
+                del self._data[key]
+            self.misses += 1
+            return None
+
+    def put(self, key, value):
+        with self._lock:
+            self._data[key] = (value, time.monotonic() + self.ttl)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'currsize': len(self._data),
+                'maxsize': self.maxsize,
+                'ttl_seconds': self.ttl
+            }
+
+
+def _s3_key(file_id: str, file_name: str, /) -> str:
+    """Build the canonical S3 object key for a stored file.
+
+    Plain `+` concatenation beats the generic f-string format machinery for
+    short paths, and this runs once per result on the list/query hot paths.
+    """
+    return "files/" + file_id + "/" + file_name
+
+
+def create_app():
+    """
+    Application factory.
+
+    Heavy imports (FastAPI, pydantic models, the S3 Vector service stack) are
+    deferred into this function so that importing `app.main` stays cheap for
+    CLI sub-commands and uvicorn worker forks. Run with
+    `uvicorn app.main:create_app --factory` (or `app.main:app`, which builds
+    lazily on first attribute access).
+    """
+    import numpy as np
+    from fastapi import Depends, FastAPI, HTTPException, UploadFile, File, Form
+    from fastapi.responses import JSONResponse, ORJSONResponse
+
+    from .models import (
+        FileUploadRequest, BatchUploadRequest, QueryRequest,
+        UploadResponse, BatchUploadResponse, QueryResponse,
+        FileResponse, HealthResponse
+    )
+    from .services.s3vector_service import S3VectorService
+    from .services.file_validation_service import FileValidationError
+    from .config import get_config
+
+    # Initialize configuration
+    config = get_config()
+
+    # Configure logging
+    logging.basicConfig(level=getattr(logging, config.server.log_level))
+
+    # Initialize FastAPI app with configuration
+    app = FastAPI(
+        title=config.server.api_title,
+        description="A service for storing and querying files in AWS S3 Vector buckets",
+        version=config.server.api_version,
+        docs_url=config.server.docs_url,
+        redoc_url=config.server.redoc_url,
+        default_response_class=ORJSONResponse
+    )
+
+    @app.on_event("startup")
+    async def startup_event():
+        """Initialize the S3 Vector service on startup"""
+        try:
+            app.state.s3vector_service = S3VectorService(config)
+            # Bound the number of blocking S3/embedding calls running in the
+            # default thread pool so a burst of uploads cannot starve queries.
+            app.state.upload_sem = asyncio.Semaphore(config.performance.max_concurrent_uploads)
+            app.state.query_sem = asyncio.Semaphore(config.performance.max_concurrent_queries)
+            app.state.embedding_cache = (
+                _TTLCache(config.performance.max_cache_size,
+                          config.performance.cache_ttl_seconds)
+                if config.performance.enable_embedding_cache else None
+            )
+            logger.info("S3 Vector service initialized successfully")
+        except Exception as e:
+            logger.error(f"Failed to initialize S3 Vector service: {e}")
+            raise
+
+    def get_service() -> S3VectorService:
+        """Dependency returning the service initialized at startup."""
+        service = getattr(app.state, 's3vector_service', None)
+        if service is None:
             raise HTTPException(status_code=503, detail="Service not initialized")
-        
-        return s3vector_service.file_validation_service.get_validation_config()
-    except Exception as e:
-        logger.error(f"Error getting validation config: {e}")
-        raise HTTPException(status_code=500, detail="Internal server error")
-
-
-@app.get("/config")
-async def get_service_config():
-    """Get complete service configuration (excluding sensitive data)"""
-    try:
-        return config.to_dict()
-    except Exception as e:
-        logger.error(f"Error getting service config: {e}")
-        raise HTTPException(status_code=500, detail="Internal server error")
-
-
-@app.get("/health", response_model=HealthResponse)
-async def health_check():
-    """Health check endpoint"""
-    try:
-        if s3vector_service is None:
+        return service
+
+    @app.get("/validation-config")
+    async def get_validation_config(svc: S3VectorService = Depends(get_service)):
+        """Get current file validation configuration"""
+        try:
+            return svc.file_validation_service.get_validation_config()
+        except Exception as e:
+            logger.error(f"Error getting validation config: {e}")
+            raise HTTPException(status_code=500, detail="Internal server error")
+
+    @app.get("/cache/stats")
+    async def get_cache_stats():
+        """Get query-embedding cache statistics"""
+        cache = getattr(app.state, 'embedding_cache', None)
+        if cache is None:
+            return {'enabled': False}
+        return {'enabled': True, **cache.stats()}
+
+    @app.get("/config")
+    async def get_service_config():
+        """Get complete service configuration (excluding sensitive data)"""
+        try:
+            return config.to_dict()
+        except Exception as e:
+            logger.error(f"Error getting service config: {e}")
+            raise HTTPException(status_code=500, detail="Internal server error")
+
+    # Liveness probes arrive every few seconds; serve them from a short-lived
+    # cache and refresh in the background instead of hitting S3 per probe.
+    health_ttl = 5.0
+
+    def _probe_health(service) -> HealthResponse:
+        try:
+            health_info = service.health_check()
+            return HealthResponse(
+                status=health_info['status'],
+                s3_connection=health_info.get('s3_connection', False),
+                s3_vectors_connection=health_info.get('s3_vectors_connection', False),
+                embedding_service=health_info.get('embedding_service', False),
+                vector_bucket_name=health_info.get('vector_bucket_name'),
+                vector_index_name=health_info.get('vector_index_name'),
+                version="1.0.0"
+            )
+        except Exception as e:
+            return HealthResponse(
+                status="unhealthy",
+                s3_connection=False,
+                s3_vectors_connection=False,
+                embedding_service=False,
+                vector_bucket_name=None,
+                vector_index_name=None,
+                error=str(e)
+            )
+
+    async def _refresh_health(service):
+        try:
+            response = await asyncio.to_thread(_probe_health, service)
+            app.state.last_health = (time.monotonic(), response)
+        finally:
+            app.state.health_refreshing = False
+
+    @app.get("/health", response_model=HealthResponse)
+    async def health_check():
+        """Health check endpoint (cached, stale-while-revalidate)"""
+        service = getattr(app.state, 's3vector_service', None)
+        if service is None:
             return HealthResponse(
                 status="unhealthy",
                 s3_connection=False,
@@ -85,354 +209,378 @@ async def health_check():
                 vector_index_name=None,
                 error="Service not initialized"
             )
-        
-        health_info = s3vector_service.health_check()
-        return HealthResponse(
-            status=health_info['status'],
-            s3_connection=health_info.get('s3_connection', False),
-            s3_vectors_connection=health_info.get('s3_vectors_connection', False),
-            embedding_service=health_info.get('embedding_service', False),
-            vector_bucket_name=health_info.get('vector_bucket_name'),
-            vector_index_name=health_info.get('vector_index_name'),
-            version="1.0.0"
-        )
-    except Exception as e:
-        return HealthResponse(
-            status="unhealthy",
-            s3_connection=False,
-            s3_vectors_connection=False,
-            embedding_service=False,
-            vector_bucket_name=None,
-            vector_index_name=None,
-            error=str(e)
-        )
 
+        cached = getattr(app.state, 'last_health', None)
+        if cached is not None:
+            if (time.monotonic() - cached[0] >= health_ttl
+                    and not getattr(app.state, 'health_refreshing', False)):
+                app.state.health_refreshing = True
+                asyncio.create_task(_refresh_health(service))
+            return cached[1]
 
-@app.post("/upload", response_model=UploadResponse)
-async def upload_file(request: FileUploadRequest):
-    """Upload a single file with vector embedding"""
-    try:
-        if s3vector_service is None:
-            raise HTTPException(status_code=503, detail="Service not initialized")
-        
-        start_time = time.time()
-        
-        # Upload file
-        file_id = s3vector_service.upload_file(
-            file_path=request.file_path,
-            metadata=request.metadata,
-            content_type=request.content_type
-        )
-        
-        upload_time = (time.time() - start_time) * 1000  # Convert to milliseconds
-        
-        # Get file info for response
-        file_info = s3vector_service.get_file_info(file_id)
-        if not file_info:
-            raise HTTPException(status_code=500, detail="Failed to retrieve file information")
-        
-        file_metadata = file_info['file_metadata']
-        
-        return UploadResponse(
-            file_id=file_id,
-            file_name=file_metadata.get('file_name', 'unknown'),
-            file_size=file_metadata.get('file_size', 0),
-            vector_dimension=file_info['vector_dimension'],
-            upload_time_ms=upload_time,
-            s3_key=f"files/{file_id}/{file_metadata.get('file_name', 'unknown')}"
-        )
-    
-    except FileNotFoundError:
-        raise HTTPException(status_code=404, detail="File not found")
-    except FileValidationError as e:
-        logger.warning(f"File validation failed: {e}")
-        raise HTTPException(status_code=400, detail=f"File validation failed: {str(e)}")
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        logger.error(f"Error uploading file: {e}")
-        raise HTTPException(status_code=500, detail="Internal server error")
-
-
-@app.post("/upload-batch", response_model=BatchUploadResponse)
-async def upload_batch(request: BatchUploadRequest):
-    """Upload multiple files in batch"""
-    try:
-        if s3vector_service is None:
-            raise HTTPException(status_code=503, detail="Service not initialized")
-        
-        # Prepare files list for batch upload
-        files = []
-        for file_request in request.files:
-            files.append({
-                'file_path': file_request.file_path,
-                'metadata': file_request.metadata,
-                'content_type': file_request.content_type
-            })
-        
-        # Perform batch upload
-        result = s3vector_service.upload_batch(files)
-        
-        # Convert to response format
-        uploaded_files = []
-        for file_result in result['uploaded_files']:
-            file_info = s3vector_service.get_file_info(file_result['file_id'])
-            if file_info:
-                file_metadata = file_info['file_metadata']
-                uploaded_files.append(UploadResponse(
-                    file_id=file_result['file_id'],
-                    file_name=file_metadata.get('file_name', 'unknown'),
-                    file_size=file_metadata.get('file_size', 0),
-                    vector_dimension=file_info['vector_dimension'],
-                    upload_time_ms=0,  # Batch upload doesn't track individual times
-                    s3_key=f"files/{file_result['file_id']}/{file_metadata.get('file_name', 'unknown')}"
-                ))
-        
-        return BatchUploadResponse(
-            uploaded_files=uploaded_files,
-            failed_files=result['failed_files'],
-            total_files=result['total_files'],
-            success_count=result['success_count']
-        )
-    
-    except FileValidationError as e:
-        logger.warning(f"Batch file validation failed: {e}")
-        raise HTTPException(status_code=400, detail=f"Batch validation failed: {str(e)}")
-    except Exception as e:
-        logger.error(f"Error in batch upload: {e}")
-        raise HTTPException(status_code=500, detail="Internal server error")
-
-
-@app.post("/upload/file", response_model=UploadResponse)
-async def upload_file_multipart(
-    file: UploadFile = File(...),
-    metadata: Optional[str] = Form(None)
-):
-    """Upload a single file via multipart form data"""
-    try:
-        if s3vector_service is None:
-            raise HTTPException(status_code=503, detail="Service not initialized")
-        
-        start_time = time.time()
-        
-        # Parse metadata from JSON string if provided
-        file_metadata = {}
-        if metadata:
-            try:
-                file_metadata = json.loads(metadata)
-            except json.JSONDecodeError:
-                raise HTTPException(status_code=400, detail="Invalid metadata JSON format")
-        
-        # Create temporary file
-        with tempfile.NamedTemporaryFile(delete=False, suffix=f"_{file.filename}") as temp_file:
-            # Read and write file content
-            content = await file.read()
-            temp_file.write(content)
-            temp_file_path = temp_file.name
-        
+        # First call populates the cache synchronously
+        response = await asyncio.to_thread(_probe_health, service)
+        app.state.last_health = (time.monotonic(), response)
+        return response
+
+    @app.post("/upload", response_model=UploadResponse)
+    async def upload_file(request: FileUploadRequest, svc: S3VectorService = Depends(get_service)):
+        """Upload a single file with vector embedding"""
         try:
-            # Upload file using the existing service
-            file_id = s3vector_service.upload_file(
-                file_path=temp_file_path,
-                metadata=file_metadata,
-                content_type=file.content_type
-            )
-            
-            upload_time = (time.time() - start_time) * 1000  # Convert to milliseconds
-            
+            t0 = time.perf_counter_ns()
+
+            # Upload file off the event loop
+            async with app.state.upload_sem:
+                file_id = await asyncio.to_thread(
+                    svc.upload_file,
+                    request.file_path,
+                    request.metadata,
+                    request.content_type
+                )
+
+            upload_time = (time.perf_counter_ns() - t0) / 1_000_000  # milliseconds
+
             # Get file info for response
-            file_info = s3vector_service.get_file_info(file_id)
+            file_info = svc.get_file_info(file_id)
             if not file_info:
                 raise HTTPException(status_code=500, detail="Failed to retrieve file information")
-            
-            file_metadata_response = file_info['file_metadata']
-            
-            return UploadResponse(
+
+            file_metadata = file_info['file_metadata']
+            file_name = file_metadata.get('file_name') or 'unknown'
+
+            return UploadResponse.model_construct(
                 file_id=file_id,
-                file_name=file.filename or 'unknown',
-                file_size=len(content),
+                file_name=file_name,
+                file_size=int(file_metadata.get('file_size', 0)),
                 vector_dimension=file_info['vector_dimension'],
                 upload_time_ms=upload_time,
-                s3_key=f"files/{file_id}/{file.filename or 'unknown'}"
+                s3_key=_s3_key(file_id, file_name)
             )
-        
-        finally:
-            # Clean up temporary file
+
+        except FileNotFoundError:
+            raise HTTPException(status_code=404, detail="File not found")
+        except FileValidationError as e:
+            logger.warning(f"File validation failed: {e}")
+            raise HTTPException(status_code=400, detail=f"File validation failed: {str(e)}")
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        except Exception as e:
+            logger.error(f"Error uploading file: {e}")
+            raise HTTPException(status_code=500, detail="Internal server error")
+
+    @app.post("/upload-batch", response_model=BatchUploadResponse)
+    async def upload_batch(request: BatchUploadRequest, svc: S3VectorService = Depends(get_service)):
+        """Upload multiple files in batch"""
+        try:
+            # Prepare files list for batch upload
+            files = []
+            for file_request in request.files:
+                files.append({
+                    'file_path': file_request.file_path,
+                    'metadata': file_request.metadata,
+                    'content_type': file_request.content_type
+                })
+
+            # Perform batch upload off the event loop
+            async with app.state.upload_sem:
+                result = await svc.upload_batch_async(files)
+
+            # Convert to response format (single batched metadata fetch)
+            files_info = svc.get_files_info(
+                [file_result['file_id'] for file_result in result['uploaded_files']]
+            )
+
+            uploaded_files = []
+            for file_result in result['uploaded_files']:
+                file_info = files_info.get(file_result['file_id'])
+                if file_info:
+                    file_metadata = file_info['file_metadata']
+                    file_name = file_metadata.get('file_name') or 'unknown'
+                    uploaded_files.append(UploadResponse.model_construct(
+                        file_id=file_result['file_id'],
+                        file_name=file_name,
+                        file_size=int(file_metadata.get('file_size', 0)),
+                        vector_dimension=file_info['vector_dimension'],
+                        upload_time_ms=file_result.get('upload_time_ms', 0),
+                        s3_key=_s3_key(file_result['file_id'], file_name)
+                    ))
+
+            return BatchUploadResponse.model_construct(
+                uploaded_files=uploaded_files,
+                failed_files=result['failed_files'],
+                total_files=result['total_files'],
+                success_count=result['success_count']
+            )
+
+        except FileValidationError as e:
+            logger.warning(f"Batch file validation failed: {e}")
+            raise HTTPException(status_code=400, detail=f"Batch validation failed: {str(e)}")
+        except Exception as e:
+            logger.error(f"Error in batch upload: {e}")
+            raise HTTPException(status_code=500, detail="Internal server error")
+
+    @app.post("/upload/file", response_model=UploadResponse)
+    async def upload_file_multipart(
+        file: UploadFile = File(...),
+        metadata: Optional[str] = Form(None),
+        svc: S3VectorService = Depends(get_service)
+    ):
+        """Upload a single file via multipart form data"""
+        try:
+            t0 = time.perf_counter_ns()
+
+            # Parse metadata from JSON string if provided
+            file_metadata = {}
+            if metadata:
+                try:
+                    file_metadata = json.loads(metadata)
+                except json.JSONDecodeError:
+                    raise HTTPException(status_code=400, detail="Invalid metadata JSON format")
+
+            # Create temporary file
+            with tempfile.NamedTemporaryFile(delete=False, suffix=f"_{file.filename}") as temp_file:
+                # Read and write file content
+                content = await file.read()
+                temp_file.write(content)
+                temp_file_path = temp_file.name
+
             try:
-                os.unlink(temp_file_path)
-            except OSError:
-                pass
-    
-    except FileValidationError as e:
-        logger.warning(f"File validation failed: {e}")
-        raise HTTPException(status_code=400, detail=f"File validation failed: {str(e)}")
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        logger.error(f"Error uploading file: {e}")
-        raise HTTPException(status_code=500, detail="Internal server error")
-
-
-@app.post("/query", response_model=QueryResponse)
-async def query_similar(request: QueryRequest, include_vector: bool = False):
-    """Query for similar files using vector similarity search"""
-    try:
-        if s3vector_service is None:
-            raise HTTPException(status_code=503, detail="Service not initialized")
-        
-        start_time = time.time()
-        
-        # Handle text query by embedding it to vector
-        query_vector = request.query_vector
-        if request.query_text is not None:
-            logger.info(f"Embedding query text: {request.query_text}")
-            query_vector = s3vector_service.embedding_service.generate_text_embedding(request.query_text)
-        
-        # Perform similarity query
-        results = s3vector_service.query_similar(
-            query_vector=query_vector,
-            top_k=request.top_k,
-            similarity_threshold=request.similarity_threshold,
-            metadata_filter=request.metadata_filter
-        )
-        
-        query_time = (time.time() - start_time) * 1000  # Convert to milliseconds
-        
-        # Convert results to response format
-        query_results = []
-        for result in results:
-            file_metadata = result['file_metadata']
-            query_results.append({
-                'file_id': result['file_id'],
-                'similarity_score': result['similarity_score'],
-                'file_info': FileResponse(
-                    file_id=result['file_id'],
-                    file_name=file_metadata.get('file_name', 'unknown'),
-                    file_size=file_metadata.get('file_size', 0),
-                    content_type=file_metadata.get('content_type', 'application/octet-stream'),
-                    metadata=file_metadata,
-                    vector_dimension=result['vector_dimension'],
-                    uploaded_at=file_metadata.get('uploaded_at', ''),
-                    s3_key=f"files/{result['file_id']}/{file_metadata.get('file_name', 'unknown')}"
+                # Upload file using the existing service, off the event loop
+                async with app.state.upload_sem:
+                    file_id = await asyncio.to_thread(
+                        svc.upload_file,
+                        temp_file_path,
+                        file_metadata,
+                        file.content_type
+                    )
+
+                upload_time = (time.perf_counter_ns() - t0) / 1_000_000  # milliseconds
+
+                # Get file info for response
+                file_info = svc.get_file_info(file_id)
+                if not file_info:
+                    raise HTTPException(status_code=500, detail="Failed to retrieve file information")
+
+                file_metadata_response = file_info['file_metadata']
+
+                file_name = file.filename or 'unknown'
+
+                return UploadResponse.model_construct(
+                    file_id=file_id,
+                    file_name=file_name,
+                    file_size=len(content),
+                    vector_dimension=file_info['vector_dimension'],
+                    upload_time_ms=upload_time,
+                    s3_key=_s3_key(file_id, file_name)
                 )
-            })
-        
-        return QueryResponse(
-            query_vector=query_vector if include_vector else None,
-            results=query_results,
-            total_results=len(query_results),
-            query_time_ms=query_time
-        )
-    
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        logger.error(f"Error in similarity query: {e}")
-        raise HTTPException(status_code=500, detail="Internal server error")
-
-
-@app.get("/files", response_model=List[FileResponse])
-async def list_files(limit: int = 100):
-    """List all files in the bucket"""
-    try:
-        if s3vector_service is None:
-            raise HTTPException(status_code=503, detail="Service not initialized")
-        
-        files = s3vector_service.list_files(limit=limit)
-        
-        # Convert to response format
-        file_responses = []
-        for file_info in files:
-            metadata = file_info['metadata']
-            file_responses.append(FileResponse(
-                file_id=file_info['file_id'],
-                file_name=file_info['file_name'],
-                file_size=file_info['file_size'],
-                content_type=metadata.get('content_type', 'application/octet-stream'),
-                metadata=metadata,
-                vector_dimension=metadata.get('vector_dimension', 0),
-                uploaded_at=metadata.get('uploaded_at', ''),
-                s3_key=file_info.get('s3_key', f"files/{file_info['file_id']}/{file_info['file_name']}")
-            ))
-        
-        return file_responses
-    
-    except Exception as e:
-        logger.error(f"Error listing files: {e}")
-        raise HTTPException(status_code=500, detail="Internal server error")
-
-
-@app.get("/files/{file_id}", response_model=FileResponse)
-async def get_file_info(file_id: str):
-    """Get information about a specific file"""
-    try:
-        if s3vector_service is None:
-            raise HTTPException(status_code=503, detail="Service not initialized")
-        
-        file_info = s3vector_service.get_file_info(file_id)
-        if not file_info:
-            raise HTTPException(status_code=404, detail="File not found")
-        
-        file_metadata = file_info['file_metadata']
-        
-        return FileResponse(
-            file_id=file_id,
-            file_name=file_metadata.get('file_name', 'unknown'),
-            file_size=file_metadata.get('file_size', 0),
-            content_type=file_metadata.get('content_type', 'application/octet-stream'),
-            metadata=file_metadata,
-            vector_dimension=file_info['vector_dimension'],
-            uploaded_at=file_metadata.get('uploaded_at', ''),
-            s3_key=f"files/{file_id}/{file_metadata.get('file_name', 'unknown')}"
+
+            finally:
+                # Clean up temporary file
+                try:
+                    os.unlink(temp_file_path)
+                except OSError:
+                    pass
+
+        except FileValidationError as e:
+            logger.warning(f"File validation failed: {e}")
+            raise HTTPException(status_code=400, detail=f"File validation failed: {str(e)}")
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        except Exception as e:
+            logger.error(f"Error uploading file: {e}")
+            raise HTTPException(status_code=500, detail="Internal server error")
+
+    @app.post("/query", response_model=QueryResponse, response_class=ORJSONResponse)
+    async def query_similar(
+        request: QueryRequest,
+        include_vector: bool = False,
+        compact: bool = False,
+        svc: S3VectorService = Depends(get_service)
+    ):
+        """Query for similar files using vector similarity search.
+
+        With `compact=true` the echoed query vector is returned as
+        `query_vector_b64`: base64-encoded raw float32 bytes (decode with
+        `np.frombuffer(base64.b64decode(s), dtype=np.float32)`), roughly a
+        third of the JSON float-array size.
+        """
+        try:
+            t0 = time.perf_counter_ns()
+
+            # Handle text query by embedding it to vector
+            query_vector = request.query_vector
+            async with app.state.query_sem:
+                if request.query_text is not None:
+                    logger.info(f"Embedding query text: {request.query_text}")
+                    cache = app.state.embedding_cache
+                    query_vector = cache.get(request.query_text) if cache else None
+                    if query_vector is None:
+                        query_vector = await asyncio.to_thread(
+                            svc.embedding_service.generate_text_embedding, request.query_text
+                        )
+                        if cache:
+                            cache.put(request.query_text, query_vector)
+
+                # Perform similarity query off the event loop
+                results = await svc.query_similar_async(
+                    query_vector,
+                    request.top_k,
+                    request.similarity_threshold,
+                    request.metadata_filter
+                )
+
+            query_time = (time.perf_counter_ns() - t0) / 1_000_000  # milliseconds
+
+            # Convert results to plain dicts and serialize once with orjson,
+            # skipping FastAPI's response-model validation pass on the hot path
+            # (QueryResponse stays declared above for the OpenAPI schema).
+            query_results = []
+            for result in results:
+                file_metadata = result['file_metadata']
+                file_name = file_metadata.get('file_name') or 'unknown'
+                query_results.append({
+                    'file_id': result['file_id'],
+                    'similarity_score': result['similarity_score'],
+                    'file_info': {
+                        'file_id': result['file_id'],
+                        'file_name': file_name,
+                        'file_size': int(file_metadata.get('file_size', 0)),
+                        'content_type': file_metadata.get('content_type', 'application/octet-stream'),
+                        'metadata': file_metadata,
+                        'vector_dimension': result['vector_dimension'],
+                        'uploaded_at': file_metadata.get('uploaded_at', ''),
+                        's3_key': _s3_key(result['file_id'], file_name)
+                    }
+                })
+
+            response = {
+                'query_vector': query_vector if include_vector else None,
+                'results': query_results,
+                'total_results': len(query_results),
+                'query_time_ms': query_time
+            }
+            if compact and include_vector and query_vector is not None:
+                response['query_vector'] = None
+                response['query_vector_b64'] = base64.b64encode(
+                    np.asarray(query_vector, dtype=np.float32).tobytes()
+                ).decode()
+
+            return ORJSONResponse(response)
+
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        except Exception as e:
+            logger.error(f"Error in similarity query: {e}")
+            raise HTTPException(status_code=500, detail="Internal server error")
+
+    @app.get("/files", response_model=List[FileResponse], response_class=ORJSONResponse)
+    async def list_files(limit: int = 100, svc: S3VectorService = Depends(get_service)):
+        """List all files in the bucket"""
+        try:
+            async with app.state.query_sem:
+                files = await asyncio.to_thread(svc.list_files, limit)
+
+            # Convert to plain dicts and serialize once with orjson, skipping
+            # FastAPI's response-model validation pass on the hot path.
+            file_responses = []
+            for file_info in files:
+                metadata = file_info['metadata']
+                file_responses.append({
+                    'file_id': file_info['file_id'],
+                    'file_name': file_info['file_name'],
+                    'file_size': file_info['file_size'],
+                    'content_type': metadata.get('content_type', 'application/octet-stream'),
+                    'metadata': metadata,
+                    'vector_dimension': int(metadata.get('vector_dimension', 0)),
+                    'uploaded_at': metadata.get('uploaded_at', ''),
+                    's3_key': file_info.get('s3_key') or _s3_key(file_info['file_id'], file_info['file_name'])
+                })
+
+            return ORJSONResponse(file_responses)
+
+        except Exception as e:
+            logger.error(f"Error listing files: {e}")
+            raise HTTPException(status_code=500, detail="Internal server error")
+
+    @app.get("/files/{file_id}", response_model=FileResponse)
+    async def get_file_info(file_id: str, svc: S3VectorService = Depends(get_service)):
+        """Get information about a specific file"""
+        try:
+            file_info = svc.get_file_info(file_id)
+            if not file_info:
+                raise HTTPException(status_code=404, detail="File not found")
+
+            file_metadata = file_info['file_metadata']
+            file_name = file_metadata.get('file_name') or 'unknown'
+
+            return FileResponse.model_construct(
+                file_id=file_id,
+                file_name=file_name,
+                file_size=int(file_metadata.get('file_size', 0)),
+                content_type=file_metadata.get('content_type', 'application/octet-stream'),
+                metadata=file_metadata,
+                vector_dimension=file_info['vector_dimension'],
+                uploaded_at=file_metadata.get('uploaded_at', ''),
+                s3_key=_s3_key(file_id, file_name)
+            )
+
+        except HTTPException:
+            raise
+        except Exception as e:
+            logger.error(f"Error getting file info: {e}")
+            raise HTTPException(status_code=500, detail="Internal server error")
+
+    @app.delete("/files/{file_id}")
+    async def delete_file(file_id: str, svc: S3VectorService = Depends(get_service)):
+        """Delete a specific file and its vector embedding"""
+        try:
+            success = svc.delete_file(file_id)
+            if not success:
+                raise HTTPException(status_code=404, detail="File not found or could not be deleted")
+
+            return {"message": f"File {file_id} deleted successfully"}
+
+        except HTTPException:
+            raise
+        except Exception as e:
+            logger.error(f"Error deleting file: {e}")
+            raise HTTPException(status_code=500, detail="Internal server error")
+
+    @app.exception_handler(Exception)
+    async def global_exception_handler(request, exc):
+        """Global exception handler"""
+        logger.error(f"Unhandled exception: {exc}")
+        # Literal dict matching the ErrorResponse schema; skips model
+        # validation so an error storm doesn't pay the pydantic round-trip
+        return JSONResponse(
+            status_code=500,
+            content={"error": "Internal server error", "details": str(exc)}
         )
-    
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error getting file info: {e}")
-        raise HTTPException(status_code=500, detail="Internal server error")
-
-
-@app.delete("/files/{file_id}")
-async def delete_file(file_id: str):
-    """Delete a specific file and its vector embedding"""
-    try:
-        if s3vector_service is None:
-            raise HTTPException(status_code=503, detail="Service not initialized")
-        
-        success = s3vector_service.delete_file(file_id)
-        if not success:
-            raise HTTPException(status_code=404, detail="File not found or could not be deleted")
-        
-        return {"message": f"File {file_id} deleted successfully"}
-    
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error deleting file: {e}")
-        raise HTTPException(status_code=500, detail="Internal server error")
-
-
-@app.exception_handler(Exception)
-async def global_exception_handler(request, exc):
-    """Global exception handler"""
-    logger.error(f"Unhandled exception: {exc}")
-    return JSONResponse(
-        status_code=500,
-        content=ErrorResponse(
-            error="Internal server error",
-            details=str(exc)
-        ).dict()
-    )
+
+    return app
+
+
+def __getattr__(name):
+    # Build the app lazily so `uvicorn app.main:app` keeps working without
+    # paying the FastAPI/pydantic import cost on plain `import app.main`.
+    if name == "app":
+        application = create_app()
+        globals()["app"] = application
+        return application
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 if __name__ == "__main__":
     import uvicorn
-    
+
+    from .config import get_config
+
+    config = get_config()
     uvicorn.run(
-        "app.main:app",
+        "app.main:create_app",
+        factory=True,
         host=config.server.host,
         port=config.server.port,
         reload=config.server.debug,
-        log_level=config.server.log_level.value.lower()
-    ) 
\ No newline at end of file
+        log_level=config.server.log_level.lower()
+    )
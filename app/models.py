@@ -1,11 +1,15 @@
-from pydantic import BaseModel, Field
+import base64
+
+import numpy as np
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 from typing import List, Dict, Optional, Any
-from datetime import datetime
+from datetime import datetime, timezone
 import uuid
 
 
 class FileUploadRequest(BaseModel):
     """Request model for file upload with metadata"""
+    model_config = ConfigDict(defer_build=True)
     file_path: str = Field(..., description="Path to the file to upload")
     metadata: Dict[str, Any] = Field(default_factory=dict, description="File metadata")
     content_type: Optional[str] = Field(None, description="Content type of the file")
@@ -13,34 +17,55 @@ class FileUploadRequest(BaseModel):
 
 class BatchUploadRequest(BaseModel):
     """Request model for batch file upload"""
+    model_config = ConfigDict(defer_build=True)
     files: List[FileUploadRequest] = Field(..., description="List of files to upload")
 
 
 class QueryRequest(BaseModel):
     """Request model for vector similarity query"""
-    query_vector: Optional[List[float]] = Field(None, description="Query vector for similarity search")
+    model_config = ConfigDict(defer_build=True)
+    query_vector: Optional[List[float]] = Field(
+        None,
+        description="Query vector for similarity search; accepts a JSON float "
+                    "array or base64-encoded raw float32 bytes"
+    )
     query_text: Optional[str] = Field(None, description="Query text to be embedded for similarity search")
+
+    @field_validator('query_vector', mode='before')
+    @classmethod
+    def _decode_compact_vector(cls, v):
+        """Decode base64 float32 / ndarray / raw-bytes vectors in one C-level pass.
+
+        A 768-d vector arrives as ~4 KB of base64 instead of ~9 KB of JSON
+        floats, and the decode is a single np.frombuffer instead of parsing
+        each number.
+        """
+        if v is None or isinstance(v, list):
+            return v
+        if isinstance(v, str):
+            v = base64.b64decode(v)
+        if isinstance(v, (bytes, bytearray, memoryview)):
+            return np.frombuffer(v, dtype=np.float32).tolist()
+        if isinstance(v, np.ndarray):
+            return v.tolist()
+        return v
     top_k: int = Field(default=10, ge=1, le=100, description="Number of top results to return")
     similarity_threshold: Optional[float] = Field(None, ge=0.0, le=1.0, description="Minimum similarity threshold")
     metadata_filter: Optional[Dict[str, Any]] = Field(None, description="Metadata filter for query results")
     
-    @classmethod
-    def model_validate(cls, data):
+    @model_validator(mode='after')
+    def _check_exactly_one_query_input(self):
         """Validate that either query_vector or query_text is provided, but not both"""
-        if isinstance(data, dict):
-            query_vector = data.get('query_vector')
-            query_text = data.get('query_text')
-            
-            if query_vector is not None and query_text is not None:
-                raise ValueError("Provide either query_vector or query_text, not both")
-            if query_vector is None and query_text is None:
-                raise ValueError("Either query_vector or query_text must be provided")
-        
-        return super().model_validate(data)
+        if self.query_vector is not None and self.query_text is not None:
+            raise ValueError("Provide either query_vector or query_text, not both")
+        if self.query_vector is None and self.query_text is None:
+            raise ValueError("Either query_vector or query_text must be provided")
+        return self
 
 
 class FileResponse(BaseModel):
     """Response model for file information"""
+    model_config = ConfigDict(defer_build=True)
     file_id: str = Field(..., description="Unique file identifier")
     file_name: str = Field(..., description="Original file name")
     file_size: int = Field(..., description="File size in bytes")
@@ -53,6 +78,7 @@ class FileResponse(BaseModel):
 
 class QueryResult(BaseModel):
     """Response model for query results"""
+    model_config = ConfigDict(defer_build=True)
     file_id: str = Field(..., description="File identifier")
     similarity_score: float = Field(..., description="Similarity score")
     file_info: FileResponse = Field(..., description="File information")
@@ -60,6 +86,7 @@ class QueryResult(BaseModel):
 
 class QueryResponse(BaseModel):
     """Response model for similarity query"""
+    model_config = ConfigDict(defer_build=True)
     query_vector: Optional[List[float]] = Field(None, description="Query vector used (optional)")
     results: List[QueryResult] = Field(..., description="Query results")
     total_results: int = Field(..., description="Total number of results")
@@ -68,6 +95,7 @@ class QueryResponse(BaseModel):
 
 class UploadResponse(BaseModel):
     """Response model for file upload"""
+    model_config = ConfigDict(defer_build=True)
     file_id: str = Field(..., description="Unique file identifier")
     file_name: str = Field(..., description="Original file name")
     file_size: int = Field(..., description="File size in bytes")
@@ -78,6 +106,7 @@ class UploadResponse(BaseModel):
 
 class BatchUploadResponse(BaseModel):
     """Response model for batch upload"""
+    model_config = ConfigDict(defer_build=True)
     uploaded_files: List[UploadResponse] = Field(..., description="Successfully uploaded files")
     failed_files: List[Dict[str, Any]] = Field(default_factory=list, description="Failed uploads with error details")
     total_files: int = Field(..., description="Total number of files processed")
@@ -86,15 +115,17 @@ class BatchUploadResponse(BaseModel):
 
 class ErrorResponse(BaseModel):
     """Error response model"""
+    model_config = ConfigDict(defer_build=True)
     error: str = Field(..., description="Error message")
     details: Optional[str] = Field(None, description="Additional error details")
-    timestamp: datetime = Field(default_factory=datetime.utcnow, description="Error timestamp")
+    timestamp: datetime = Field(default_factory=lambda: datetime.now(timezone.utc), description="Error timestamp")
 
 
 class HealthResponse(BaseModel):
     """Health check response model"""
+    model_config = ConfigDict(defer_build=True)
     status: str = Field(..., description="Service status")
-    timestamp: datetime = Field(default_factory=datetime.utcnow, description="Health check timestamp")
+    timestamp: datetime = Field(default_factory=lambda: datetime.now(timezone.utc), description="Health check timestamp")
     version: str = Field(default="1.0.0", description="Service version")
     s3_connection: bool = Field(..., description="S3 connection status")
     s3_vectors_connection: Optional[bool] = Field(None, description="S3 Vectors connection status")
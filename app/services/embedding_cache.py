@@ -0,0 +1,136 @@
+import hashlib
+import mmap
+import os
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+import numpy as np
+
+# On-disk tier shared by every process on the machine; ~/.cache follows the
+# same convention as the CLI's query-embedding cache
+_DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "s3vector", "file_emb")
+
+# Bytes hashed per read on the non-mmap fallback path; keeps memory constant
+# for arbitrarily large files
+_HASH_BLOCK = 1 << 20
+
+
+def hash_file(file_path: str) -> str:
+    """Fingerprint a file's content with blake2b.
+
+    blake2b is the fastest hash in hashlib and 16 bytes of digest is plenty
+    for cache addressing; the same content always maps to the same key no
+    matter the path, mtime, or which process uploaded it first.
+
+    The file is mmapped so the digest runs in one C-level pass over the page
+    cache with no intermediate copies; empty files and filesystems without
+    mmap support fall back to block reads.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    with open(file_path, 'rb') as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            while True:
+                block = f.read(_HASH_BLOCK)
+                if not block:
+                    break
+                h.update(block)
+        else:
+            with mm:
+                h.update(mm)
+    return h.hexdigest()
+
+
+class EmbeddingCache:
+    """Content-addressed embedding cache.
+
+    Maps (content hash, model name) to the stored float32 embedding so
+    re-ingesting identical bytes — re-uploaded, renamed, or copied files —
+    skips the embedding forward pass entirely. Bounded LRU, thread-safe,
+    in-process like the service's other caches.
+
+    When a cache_dir is given, entries are also persisted as sharded .npy
+    files so identical content survives process restarts; the disk tier is
+    best-effort and an unwritable directory silently disables it.
+    """
+
+    def __init__(self, max_entries: int = 4096, cache_dir: Optional[str] = None):
+        self.max_entries = max_entries
+        self.cache_dir = cache_dir
+        self._entries: "OrderedDict[tuple, np.ndarray]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def _disk_path(self, file_hash: str, model: str) -> str:
+        # Model names contain path separators, so the filename is a digest
+        # of (content hash, model); two-character shards keep directories
+        # from growing unbounded
+        name = hashlib.blake2b(f"{file_hash}\n{model}".encode(), digest_size=16).hexdigest()
+        return os.path.join(self.cache_dir, name[:2], f"{name[2:]}.npy")
+
+    def get(self, file_hash: str, model: str) -> Optional[np.ndarray]:
+        """Return the cached embedding for this content/model pair, or None"""
+        key = (file_hash, model)
+        with self._lock:
+            embedding = self._entries.get(key)
+            if embedding is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return embedding
+
+        if self.cache_dir is not None:
+            try:
+                embedding = np.load(self._disk_path(file_hash, model))
+            except (OSError, ValueError):
+                embedding = None
+            if embedding is not None:
+                # Promote to the in-memory tier without re-writing the file
+                with self._lock:
+                    self._entries[key] = embedding
+                    self._entries.move_to_end(key)
+                    if len(self._entries) > self.max_entries:
+                        self._entries.popitem(last=False)
+                    self._hits += 1
+                return embedding
+
+        with self._lock:
+            self._misses += 1
+        return None
+
+    def put(self, file_hash: str, model: str, embedding: np.ndarray) -> None:
+        """Store an embedding, evicting the least recently used entry if full"""
+        if self.max_entries <= 0:
+            return
+        key = (file_hash, model)
+        with self._lock:
+            self._entries[key] = embedding
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+        if self.cache_dir is not None:
+            path = self._disk_path(file_hash, model)
+            try:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                np.save(path, np.asarray(embedding))
+            except OSError:
+                pass
+
+    def stats(self) -> dict:
+        """Hit/miss counters and current occupancy"""
+        with self._lock:
+            return {
+                'hits': self._hits,
+                'misses': self._misses,
+                'currsize': len(self._entries),
+                'maxsize': self.max_entries
+            }
+
+
+# Shared process-wide instance; services import and reuse this so duplicate
+# content is recognized across service objects, and the disk tier extends
+# that across runs
+default_cache = EmbeddingCache(cache_dir=_DEFAULT_CACHE_DIR)
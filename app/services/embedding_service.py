@@ -1,120 +1,396 @@
 import os
+import hashlib
+import re
+import threading
 import numpy as np
+from collections import OrderedDict
 from typing import List, Optional, Union
 from sentence_transformers import SentenceTransformer
-from PIL import Image
-import io
-import base64
 import logging
 from ..config import get_config, VectorConfig
 
-# Add PDF text extraction support
-try:
-    from pypdf import PdfReader
-    PDF_SUPPORT = True
-except ImportError:
-    PDF_SUPPORT = False
-    logging.warning("pypdf not available. PDF text extraction will be limited.")
-
 logger = logging.getLogger(__name__)
 
+# PDF backend resolved lazily on the first PDF so text-only deployments
+# never pay the import. pdfium wraps a C++ engine and extracts text an
+# order of magnitude faster than pypdf; pypdf stays as the fallback.
+# Values: None = not probed yet, 'pdfium', 'pypdf', False = neither.
+_PDF_BACKEND = None
+
+
+def _pdf_backend():
+    global _PDF_BACKEND
+    if _PDF_BACKEND is None:
+        try:
+            import pypdfium2  # noqa: F401
+            _PDF_BACKEND = 'pdfium'
+        except ImportError:
+            try:
+                import pypdf  # noqa: F401
+                _PDF_BACKEND = 'pypdf'
+            except ImportError:
+                _PDF_BACKEND = False
+                logger.warning("pypdf not available. PDF text extraction will be limited.")
+    return _PDF_BACKEND
+
+# Whitespace collapse for _preprocess_text; a single C-level regex pass
+# instead of split()+join building two intermediate lists
+_WS_RE = re.compile(r'\s+')
+
+# Bytes read from a file per unit of max_text_length. Caps every file read
+# at a constant budget — preprocessing truncates to max_text_length anyway —
+# while leaving headroom for multi-byte characters and whitespace collapse.
+_READ_BUDGET_FACTOR = 8
+
+
+def _read_budget_window(f, budget: int, strategy: str) -> bytes:
+    """Read the part of an open binary file that truncation will keep.
+
+    Which window survives _preprocess_text depends on the truncation
+    strategy: 'end' keeps the head of the text, 'start' keeps the tail,
+    'middle' keeps both ends. The read follows the same shape so a capped
+    read of a large file feeds the strategy the right bytes instead of
+    always the first ones.
+    """
+    size = os.fstat(f.fileno()).st_size
+    if size <= budget:
+        return f.read()
+    if strategy == 'start':
+        f.seek(size - budget)
+        return f.read(budget)
+    if strategy == 'middle':
+        half = budget // 2
+        head = f.read(half)
+        f.seek(size - half)
+        # The splice point lands mid-file, but preprocessing discards the
+        # middle of over-budget text anyway
+        return head + f.read(half)
+    return f.read(budget)  # 'end' (default)
+
+
+def quantize_embedding(vector: np.ndarray) -> np.ndarray:
+    """Quantize a unit-norm embedding to int8 (implicit scale 1/127).
+
+    Quarters the bytes streamed per vector in bulk similarity search; the
+    encode paths normalize embeddings, so a single global scale suffices.
+
+    In-process use only: the S3 Vectors PutVectors API accepts float32
+    lists exclusively, so quantized vectors cannot be shipped on the wire.
+    """
+    v = np.asarray(vector, dtype=np.float32)
+    return np.clip(np.round(v * 127.0), -128, 127).astype(np.int8)
+
+
+def int8_cosine(q1: np.ndarray, q2: np.ndarray) -> float:
+    """Cosine similarity between two int8-quantized unit embeddings."""
+    return float(q1.astype(np.int32) @ q2.astype(np.int32)) / (127.0 * 127.0)
+
+
+def batch_int8_topk(corpus_q: np.ndarray, query_q: np.ndarray, k: int):
+    """Top-k search over an int8-quantized corpus matrix.
+
+    Widening to int16 keeps the accumulate exact while still moving a
+    quarter of the float32 bytes through the cache hierarchy.
+    """
+    scores = (corpus_q.astype(np.int16) @ query_q.astype(np.int16)
+              ).astype(np.float32) / (127.0 * 127.0)
+    k = min(k, scores.shape[0])
+    if k == scores.shape[0]:
+        order = np.argsort(-scores)
+    else:
+        idx = np.argpartition(-scores, k)[:k]
+        order = idx[np.argsort(-scores[idx])]
+    return order, scores[order]
+
+
+def l2_normalize(embeddings: np.ndarray) -> np.ndarray:
+    """L2-normalize one embedding or a batch of them.
+
+    Accepts a (d,) vector or an (N, d) matrix; the norm reduction and scale
+    run as numpy ufuncs (GIL released, SIMD via BLAS) so callers building
+    corpora from unnormalized sources don't loop row-by-row in Python.
+    Zero vectors pass through unchanged instead of dividing by zero.
+    """
+    x = np.asarray(embeddings, dtype=np.float32)
+    norms = np.linalg.norm(x, axis=-1, keepdims=True)
+    return x / np.where(norms == 0.0, 1.0, norms)
+
+
+def batch_cosine_topk(corpus: np.ndarray, query: np.ndarray, k: int):
+    """Top-k cosine search over an L2-normalized corpus matrix.
+
+    One (N, d) @ (d,) GEMV plus a partial sort instead of N per-pair
+    similarity_score calls. Assumes `corpus` rows and `query` are already
+    unit vectors (the service's encode paths normalize).
+
+    Args:
+        corpus: (N, d) float32 matrix, one normalized embedding per row
+        query: (d,) normalized query embedding
+        k: Number of results to return
+
+    Returns:
+        (indices, scores) arrays ordered by descending similarity
+    """
+    scores = corpus @ np.asarray(query, dtype=np.float32)
+    k = min(k, scores.shape[0])
+    if k == scores.shape[0]:
+        order = np.argsort(-scores)
+    else:
+        idx = np.argpartition(-scores, k)[:k]
+        order = idx[np.argsort(-scores[idx])]
+    return order, scores[order]
+
 
 class EmbeddingService:
     """Service for generating vector embeddings from different file types"""
     
-    def __init__(self, model_name: Optional[str] = None, config: Optional[VectorConfig] = None):
+    def __init__(self, model_name: Optional[str] = None, config: Optional[VectorConfig] = None,
+                 device: Optional[str] = None):
         """
         Initialize the embedding service
-        
+
         Args:
             model_name: Name of the sentence transformer model to use (overrides config)
             config: Optional VectorConfig instance. If None, uses global config.
+            device: Torch device for inference ("cuda", "cpu", ...). Defaults
+                to CUDA when available.
         """
         if config is None:
             config = get_config().vector
-        
+
         self.config = config
-        self.model_name = model_name or str(config.embedding_model.value)
+        self.model_name = model_name or config.embedding_model
+        if device is None:
+            import torch
+            device = "cuda" if torch.cuda.is_available() else "cpu"
+        self.device = device
         self.model = None
         self._load_model()
+        # CLIP-style models embed images natively; others fall back to the
+        # legacy base64-as-text representation for image files
+        self.supports_images = 'clip' in self.model_name.lower()
+
+        # Content-addressed LRU caches: duplicate texts (reindexing, repeated
+        # queries) and unchanged files skip the transformer forward pass
+        self._cache_size = getattr(config, 'embedding_cache_size', 1000)
+        self._text_cache = OrderedDict()
+        self._file_cache = OrderedDict()
+        self._cache_lock = threading.Lock()
     
     def _load_model(self):
-        """Load the sentence transformer model"""
+        """Load the sentence transformer model.
+
+        When EMBEDDING_BACKEND selects 'onnx' or 'openvino', inference runs
+        through the corresponding sentence-transformers backend (quantized
+        CPU inference, with the exported artifact cached on disk by the
+        library). Falls back to the default torch backend if the optional
+        runtime is not installed.
+        """
+        backend = getattr(self.config, 'embedding_backend', 'torch')
+        if backend != 'torch':
+            try:
+                self.model = SentenceTransformer(self.model_name, backend=backend,
+                                                 device=self.device)
+                self._embedding_dim = int(self.model.get_sentence_embedding_dimension())
+                logger.info(f"Loaded embedding model: {self.model_name} (backend={backend})")
+                return
+            except Exception as e:
+                logger.warning(
+                    f"Failed to load {backend} backend for {self.model_name} "
+                    f"({e}); falling back to torch"
+                )
         try:
-            self.model = SentenceTransformer(self.model_name)
-            logger.info(f"Loaded embedding model: {self.model_name}")
+            self.model = SentenceTransformer(self.model_name, device=self.device)
+            self._embedding_dim = int(self.model.get_sentence_embedding_dimension())
+            logger.info(f"Loaded embedding model: {self.model_name} (device={self.device})")
         except Exception as e:
             logger.error(f"Failed to load embedding model: {e}")
             raise
     
     def get_embedding_dimension(self) -> int:
-        """Get the dimension of the embeddings"""
+        """Get the dimension of the embeddings (cached at model load)"""
         if self.model is None:
             raise RuntimeError("Model not loaded")
-        return self.model.get_sentence_embedding_dimension()
+        return self._embedding_dim
     
-    def generate_text_embedding(self, text: str) -> List[float]:
+    def generate_text_embedding(self, text: str) -> np.ndarray:
         """
         Generate embedding for text content
-        
+
         Args:
             text: Text content to embed
-            
+
         Returns:
-            List of float values representing the embedding
+            float32 numpy array representing the embedding
         """
         try:
             # Clean and prepare text
             text = self._preprocess_text(text)
-            
-            # Generate embedding
-            embedding = self.model.encode(text)
-            
-            # Convert to list of floats
-            return embedding.tolist()
-        
+
+            key = hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest()
+            cached = self._cache_get(self._text_cache, key)
+            if cached is not None:
+                return cached
+
+            # Generate embedding; keep the model's float32 array instead of
+            # boxing every component into a Python float
+            embedding = self.model.encode(text, convert_to_numpy=True,
+                                          normalize_embeddings=True,
+                                          show_progress_bar=False)
+            embedding = np.asarray(embedding, dtype=np.float32)
+            self._cache_put(self._text_cache, key, embedding)
+            return embedding
+
         except Exception as e:
             logger.error(f"Error generating text embedding: {e}")
             raise
+
+    def _cache_get(self, cache: OrderedDict, key) -> Optional[np.ndarray]:
+        if self._cache_size == 0:
+            return None
+        with self._cache_lock:
+            embedding = cache.get(key)
+            if embedding is not None:
+                cache.move_to_end(key)
+            return embedding
+
+    def _cache_put(self, cache: OrderedDict, key, embedding: np.ndarray):
+        if self._cache_size == 0:
+            return
+        with self._cache_lock:
+            cache[key] = embedding
+            cache.move_to_end(key)
+            while len(cache) > self._cache_size:
+                cache.popitem(last=False)
     
-    def generate_file_embedding(self, file_path: str, content_type: Optional[str] = None) -> List[float]:
+    def generate_file_embedding(self, file_path: str, content_type: Optional[str] = None,
+                                stat_result: Optional[os.stat_result] = None) -> np.ndarray:
         """
         Generate embedding for a file based on its content type
-        
+
         Args:
             file_path: Path to the file
             content_type: MIME type of the file (optional, will be inferred if not provided)
-            
+            stat_result: Optional os.stat result for the file, e.g. from a
+                preceding validation pass, to avoid re-statting
+
         Returns:
-            List of float values representing the embedding
+            float32 numpy array representing the embedding
         """
-        if not os.path.exists(file_path):
-            raise FileNotFoundError(f"File not found: {file_path}")
-        
         # Determine content type if not provided
         if content_type is None:
             content_type = self._infer_content_type(file_path)
-        
+
         try:
-            if content_type.startswith('text/'):
-                return self._embed_text_file(file_path)
-            elif content_type.startswith('image/'):
-                return self._embed_image_file(file_path)
-            elif content_type == 'application/pdf':
-                return self._embed_pdf_file(file_path)
+            # Key on path + size + mtime so unchanged re-uploads skip both
+            # extraction and the forward pass
+            if stat_result is not None:
+                stat = stat_result
             else:
-                # For other file types, try to extract text content
-                return self._embed_generic_file(file_path)
-        
+                try:
+                    stat = os.stat(file_path)
+                except (FileNotFoundError, NotADirectoryError):
+                    raise FileNotFoundError(f"File not found: {file_path}")
+            key = (file_path, stat.st_size, stat.st_mtime_ns)
+            cached = self._cache_get(self._file_cache, key)
+            if cached is not None:
+                return cached
+
+            if content_type.startswith('image/') and self.supports_images:
+                embedding = self._generate_image_embedding(file_path)
+            else:
+                embedding = self.generate_text_embedding(self._extract_text(file_path, content_type))
+
+            self._cache_put(self._file_cache, key, embedding)
+            return embedding
+
         except Exception as e:
             logger.error(f"Error generating file embedding for {file_path}: {e}")
             raise
-    
+
+    def _generate_image_embedding(self, file_path: str) -> np.ndarray:
+        """Embed an image through the model's image branch (CLIP-style models)"""
+        from PIL import Image
+
+        image = Image.open(file_path)
+        if image.mode != 'RGB':
+            image = image.convert('RGB')
+
+        embedding = self.model.encode(image, convert_to_numpy=True,
+                                      normalize_embeddings=True,
+                                      show_progress_bar=False)
+        return np.asarray(embedding, dtype=np.float32)
+
+    def generate_file_embeddings(self, file_paths: List[str],
+                                 content_types: Optional[List[Optional[str]]] = None) -> np.ndarray:
+        """
+        Generate embeddings for multiple files in one batched encode pass
+
+        Text extraction (file reads, PDF parsing) runs in a thread pool, then
+        all texts go through a single model.encode() call instead of one
+        forward pass per file.
+
+        Args:
+            file_paths: Paths to the files
+            content_types: Optional MIME type per file (inferred when omitted)
+
+        Returns:
+            2-D float32 numpy array, one normalized embedding per row
+        """
+        if content_types is None:
+            content_types = [None] * len(file_paths)
+
+        for file_path in file_paths:
+            if not os.path.exists(file_path):
+                raise FileNotFoundError(f"File not found: {file_path}")
+
+        try:
+            from concurrent.futures import ThreadPoolExecutor
+
+            resolved = [ct or self._infer_content_type(path)
+                        for path, ct in zip(file_paths, content_types)]
+            image_indices = ([i for i, ct in enumerate(resolved) if ct.startswith('image/')]
+                             if self.supports_images else [])
+            text_indices = [i for i in range(len(file_paths)) if i not in set(image_indices)]
+
+            with ThreadPoolExecutor(max_workers=min(8, max(1, len(file_paths)))) as pool:
+                texts = list(pool.map(self._extract_text,
+                                      [file_paths[i] for i in text_indices],
+                                      [resolved[i] for i in text_indices]))
+
+            rows = [None] * len(file_paths)
+            if texts:
+                for i, emb in zip(text_indices, self.generate_batch_embeddings(texts)):
+                    rows[i] = emb
+            for i in image_indices:
+                rows[i] = self._generate_image_embedding(file_paths[i])
+
+            return np.stack(rows).astype(np.float32, copy=False)
+
+        except Exception as e:
+            logger.error(f"Error generating batch file embeddings: {e}")
+            raise
+
+    def _extract_text(self, file_path: str, content_type: Optional[str] = None) -> str:
+        """Extract the text used for embedding a file (no encode call)"""
+        if content_type is None:
+            content_type = self._infer_content_type(file_path)
+
+        if content_type.startswith('text/'):
+            return self._extract_text_file(file_path)
+        elif content_type.startswith('image/'):
+            return self._extract_image_text(file_path)
+        elif content_type == 'application/pdf':
+            return self._extract_pdf_text(file_path)
+        else:
+            # For other file types, try to extract text content
+            return self._extract_generic_text(file_path)
+
 
     def _preprocess_text(self, text: str) -> str:
         """Preprocess text for embedding generation"""
         # Remove extra whitespace
-        text = ' '.join(text.split())
+        text = _WS_RE.sub(' ', text).strip()
         
         # Truncate if too long (most models have token limits)
         max_length = self.config.max_text_length
@@ -131,31 +407,42 @@ class EmbeddingService:
     
     def _infer_content_type(self, file_path: str) -> str:
         """Infer content type from file extension"""
-        import mimetypes
-        
-        content_type, _ = mimetypes.guess_type(file_path)
-        if content_type is None:
-            # Default to text for unknown types
-            return 'text/plain'
-        return content_type
-    
-    def _embed_text_file(self, file_path: str) -> List[float]:
-        """Generate embedding for text files"""
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                text = f.read()
-            
-            return self.generate_text_embedding(text)
-        
-        except UnicodeDecodeError:
-            # Try with different encoding
-            with open(file_path, 'r', encoding='latin-1') as f:
-                text = f.read()
-            return self.generate_text_embedding(text)
+        from .file_validation_service import _guess_by_ext
+
+        dot = file_path.rfind('.')
+        ext = file_path[dot:].lower() if dot > file_path.rfind(os.sep) else ''
+        # Default to text for unknown types
+        return _guess_by_ext(ext) or 'text/plain'
     
-    def _embed_image_file(self, file_path: str) -> List[float]:
-        """Generate embedding for image files"""
+    def _read_text(self, file_path: str) -> str:
+        """Read a file as text in one pass.
+
+        Reads bytes once and decodes with errors='replace', so there is no
+        re-read fallback on decode failure. Only _READ_BUDGET_FACTOR times
+        the truncation budget is read — gigabyte files never get
+        materialized — and the window tracks the truncation strategy so
+        'start'/'middle' embed the tail of large files, not their head.
+        """
+        budget = self.config.max_text_length * _READ_BUDGET_FACTOR
+        with open(file_path, 'rb') as f:
+            data = _read_budget_window(f, budget, self.config.text_truncation_strategy)
+        return data.decode('utf-8', errors='replace')
+
+    def _extract_text_file(self, file_path: str) -> str:
+        """Extract text from text files"""
+        return self._read_text(file_path)
+
+    def _extract_image_text(self, file_path: str) -> str:
+        """Extract an embeddable text representation of image files.
+
+        Fallback for text-only models; CLIP-style models embed the image
+        directly via _generate_image_embedding instead.
+        """
         try:
+            import base64
+            import io
+            from PIL import Image
+
             # Load image
             image = Image.open(file_path)
             
@@ -172,38 +459,87 @@ class EmbeddingService:
             buffer = io.BytesIO()
             image.save(buffer, format=self.config.image_format)
             img_str = base64.b64encode(buffer.getvalue()).decode()
-            
+
             # Use the base64 string as text for embedding
-            return self.generate_text_embedding(f"image: {img_str}")
-        
+            return f"image: {img_str}"
+
         except Exception as e:
-            logger.error(f"Error embedding image file {file_path}: {e}")
+            logger.error(f"Error extracting text from image file {file_path}: {e}")
             raise
 
-    def _embed_pdf_file(self, file_path: str) -> List[float]:
-        """Generate embedding for PDF files by extracting text content"""
+    def _collect_pdf_chunks(self, get_page_text, num_pages: int, file_path: str) -> list:
+        """Collect (page_num, text) chunks honoring the truncation strategy.
+
+        Extraction stops once twice the truncation budget is collected
+        (_preprocess_text discards the rest anyway), walking the pages that
+        the configured truncation strategy will actually keep.
+        """
+        max_chars = self.config.max_text_length * 2
+        strategy = self.config.text_truncation_strategy
+
+        def _page_chunks(indices, limit):
+            chunks, total = [], 0
+            for page_num in indices:
+                try:
+                    page_text = get_page_text(page_num)
+                except Exception as e:
+                    logger.warning(f"Error extracting text from page {page_num + 1} of {file_path}: {e}")
+                    continue
+                if page_text.strip():  # Only add non-empty pages
+                    chunks.append((page_num, page_text))
+                    total += len(page_text)
+                    if total >= limit:
+                        break
+            return chunks
+
+        if strategy == 'start':
+            return _page_chunks(range(num_pages - 1, -1, -1), max_chars)[::-1]
+        elif strategy == 'middle':
+            chunks = _page_chunks(range(num_pages), max_chars)
+            seen = {page_num for page_num, _ in chunks}
+            chunks += [c for c in _page_chunks(range(num_pages - 1, -1, -1), max_chars)[::-1]
+                       if c[0] not in seen]
+            return chunks
+        else:  # 'end' (default)
+            return _page_chunks(range(num_pages), max_chars)
+
+    def _extract_pdf_text(self, file_path: str) -> str:
+        """Extract text content from PDF files"""
         try:
-            if not PDF_SUPPORT:
+            backend = _pdf_backend()
+            if not backend:
                 logger.warning(f"PDF text extraction not available for {file_path}, falling back to generic method")
-                return self._embed_generic_file(file_path)
-            
-            # Extract text from PDF
-            text_content = ""
-            
-            with open(file_path, 'rb') as file:
-                pdf_reader = PdfReader(file)
-                
-                # Extract text from all pages
-                for page_num, page in enumerate(pdf_reader.pages):
-                    try:
-                        page_text = page.extract_text()
-                        if page_text.strip():  # Only add non-empty pages
-                            text_content += f"\n--- Page {page_num + 1} ---\n"
-                            text_content += page_text
-                    except Exception as e:
-                        logger.warning(f"Error extracting text from page {page_num + 1} of {file_path}: {e}")
-                        continue
-            
+                return self._extract_generic_text(file_path)
+
+            # Extract text from PDF, collecting pages and joining once instead
+            # of quadratic += concatenation on the accumulated string
+            if backend == 'pdfium':
+                import pypdfium2 as pdfium
+
+                doc = pdfium.PdfDocument(file_path)
+                try:
+                    chunks = self._collect_pdf_chunks(
+                        lambda i: doc[i].get_textpage().get_text_range(),
+                        len(doc), file_path
+                    )
+                finally:
+                    doc.close()
+            else:
+                from pypdf import PdfReader
+
+                with open(file_path, 'rb') as file:
+                    pdf_reader = PdfReader(file)
+                    pages = pdf_reader.pages
+                    chunks = self._collect_pdf_chunks(
+                        lambda i: pages[i].extract_text(), len(pages), file_path
+                    )
+
+            parts = []
+            for page_num, page_text in chunks:
+                parts.append(f"\n--- Page {page_num + 1} ---\n")
+                parts.append(page_text)
+            text_content = "".join(parts)
+
             # If no text extracted, fall back to metadata
             if not text_content.strip():
                 logger.warning(f"No text content extracted from PDF {file_path}, using file metadata")
@@ -213,82 +549,82 @@ class EmbeddingService:
             else:
                 logger.info(f"Extracted {len(text_content)} characters from PDF {file_path}")
             
-            # Generate embedding from extracted text
-            return self.generate_text_embedding(text_content)
-        
+            return text_content
+
         except Exception as e:
-            logger.error(f"Error embedding PDF file {file_path}: {e}")
+            logger.error(f"Error extracting text from PDF file {file_path}: {e}")
             # Fall back to generic method on error
-            return self._embed_generic_file(file_path)
-    
-    def _embed_generic_file(self, file_path: str) -> List[float]:
-        """Generate embedding for generic files"""
-        try:
-            # Try to read as text first
-            with open(file_path, 'r', encoding='utf-8') as f:
-                text = f.read()
-            
-            return self.generate_text_embedding(text)
-        
-        except (UnicodeDecodeError, UnicodeError):
-            # If text reading fails, create a generic description
-            file_name = os.path.basename(file_path)
-            file_size = os.path.getsize(file_path)
-            text = f"file: {file_name}, size: {file_size} bytes"
-            
-            return self.generate_text_embedding(text)
+            return self._extract_generic_text(file_path)
+
+    def _extract_generic_text(self, file_path: str) -> str:
+        """Extract an embeddable text representation of generic files"""
+        # Try to read as text first; NUL bytes mark binary content for which
+        # a generic description embeds better than replacement-char noise
+        budget = self.config.max_text_length * _READ_BUDGET_FACTOR
+        with open(file_path, 'rb') as f:
+            data = _read_budget_window(f, budget, self.config.text_truncation_strategy)
+
+        if b'\x00' not in data:
+            return data.decode('utf-8', errors='replace')
+
+        # For binary content, create a generic description
+        file_name = os.path.basename(file_path)
+        file_size = os.path.getsize(file_path)
+        return f"file: {file_name}, size: {file_size} bytes"
     
-    def generate_batch_embeddings(self, texts: List[str]) -> List[List[float]]:
+    def generate_batch_embeddings(self, texts: List[str]) -> np.ndarray:
         """
         Generate embeddings for multiple texts efficiently
-        
+
         Args:
             texts: List of text strings
-            
+
         Returns:
-            List of embeddings
+            2-D float32 numpy array, one normalized embedding per row
         """
         try:
             # Preprocess texts
             processed_texts = [self._preprocess_text(text) for text in texts]
-            
-            # Generate embeddings in batch
-            embeddings = self.model.encode(processed_texts)
-            
-            # Convert to list of lists
-            return [emb.tolist() for emb in embeddings]
-        
+
+            # Generate embeddings in one batched forward pass
+            embeddings = self.model.encode(processed_texts,
+                                           batch_size=self.config.encode_batch_size,
+                                           convert_to_numpy=True,
+                                           normalize_embeddings=True,
+                                           show_progress_bar=False)
+            return np.asarray(embeddings, dtype=np.float32)
+
         except Exception as e:
             logger.error(f"Error generating batch embeddings: {e}")
             raise
     
-    def similarity_score(self, embedding1: List[float], embedding2: List[float]) -> float:
+    def similarity_score(self, embedding1: Union[List[float], np.ndarray],
+                         embedding2: Union[List[float], np.ndarray]) -> float:
         """
         Calculate cosine similarity between two embeddings
-        
+
         Args:
             embedding1: First embedding
             embedding2: Second embedding
-            
+
         Returns:
             Similarity score between 0 and 1
         """
         try:
-            # Convert to numpy arrays
-            vec1 = np.array(embedding1)
-            vec2 = np.array(embedding2)
-            
-            # Calculate cosine similarity
-            dot_product = np.dot(vec1, vec2)
-            norm1 = np.linalg.norm(vec1)
-            norm2 = np.linalg.norm(vec2)
-            
-            if norm1 == 0 or norm2 == 0:
+            # asarray is a no-copy view when the input is already a float32
+            # array (the service's native representation since the ndarray
+            # passthrough change); lists still get converted once
+            vec1 = np.asarray(embedding1, dtype=np.float32)
+            vec2 = np.asarray(embedding2, dtype=np.float32)
+
+            # Fused dot + squared norms; embeddings encoded by this service
+            # are already L2-normalized, so this reduces to the dot product
+            denom_sq = float(vec1 @ vec1) * float(vec2 @ vec2)
+            if denom_sq == 0.0:
                 return 0.0
-            
-            similarity = dot_product / (norm1 * norm2)
-            return float(similarity)
-        
+
+            return float(vec1 @ vec2) / float(np.sqrt(denom_sq))
+
         except Exception as e:
             logger.error(f"Error calculating similarity: {e}")
-            raise 
\ No newline at end of file
+            raise
\ No newline at end of file
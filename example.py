@@ -6,8 +6,8 @@ Example script demonstrating the S3 Vector service usage
 import os
 import tempfile
 import json
+from app.config import get_config
 from app.services.s3vector_service import S3VectorService
-from app.services.embedding_service import EmbeddingService
 
 
 def create_sample_files():
@@ -37,9 +37,9 @@ def example_usage():
     print("🚀 S3 Vector Service Example")
     print("=" * 50)
     
-    # Initialize the service
+    # Initialize the service with the shared configuration instance
     try:
-        service = S3VectorService()
+        service = S3VectorService(get_config())
         print("✅ S3 Vector service initialized successfully")
     except Exception as e:
         print(f"❌ Failed to initialize service: {e}")
@@ -91,10 +91,11 @@ def example_usage():
     # Query similar files
     print("\n🔍 Querying similar files...")
     try:
-        # Create a query vector (you would typically get this from user input)
-        embedding_service = EmbeddingService()
+        # Create a query vector (you would typically get this from user input);
+        # the CLI helper caches embeddings on disk across runs
+        from cli import _get_query_embedding
         query_text = "machine learning algorithms"
-        query_vector = embedding_service.generate_text_embedding(query_text)
+        query_vector = _get_query_embedding(query_text)
         
         results = service.query_similar(
             query_vector=query_vector,
@@ -19,18 +19,24 @@ import os
 import unittest
 import time
 import requests
-from dotenv import load_dotenv
+from app.config import _load_dotenv
 
 # Load environment variables
-load_dotenv()
+if os.path.exists('.env'):
+    _load_dotenv('.env')
 
 def check_service_availability(base_url="http://localhost:8000", max_attempts=10):
     """Check if the service is running and accessible"""
     print("🔍 Checking if S3 Vector service is running...")
     
+    # One session keeps the connection alive across attempts. The /health
+    # route only answers GET, so probe with a short-timeout GET directly.
+    # Backoff starts at 100ms so a service that is already up is detected
+    # almost immediately instead of after a fixed 2s sleep.
+    session = requests.Session()
     for attempt in range(max_attempts):
         try:
-            response = requests.get(f"{base_url}/health", timeout=5)
+            response = session.get(f"{base_url}/health", timeout=2)
             if response.status_code == 200:
                 health_data = response.json()
                 print(f"✅ Service is running and healthy!")
@@ -42,8 +48,8 @@ def check_service_availability(base_url="http://localhost:8000", max_attempts=10
         except requests.exceptions.RequestException as e:
             if attempt == 0:
                 print(f"⏳ Service not ready yet, waiting...")
-            time.sleep(2)
-    
+        time.sleep(min(2.0, 0.1 * 2 ** attempt))
+
     print("❌ Service is not accessible. Please ensure:")
     print("   1. Docker container is running")
     print("   2. Service is accessible on localhost:8000")
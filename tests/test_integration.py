@@ -4,10 +4,11 @@ import json
 import time
 import tempfile
 import os
-from dotenv import load_dotenv
+from app.config import _load_dotenv
 
 # Load environment variables
-load_dotenv()
+if os.path.exists('.env'):
+    _load_dotenv('.env')
 
 
 class TestS3VectorIntegration(unittest.TestCase):
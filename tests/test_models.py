@@ -0,0 +1,48 @@
+import unittest
+
+from app.models import UploadResponse, FileResponse
+
+
+class TestResponseModelConstruct(unittest.TestCase):
+    """Ensure model_construct on response models matches validated construction"""
+
+    def test_upload_response_round_trip(self):
+        """model_construct should produce the same payload as validated init"""
+        payload = {
+            'file_id': 'abc-123',
+            'file_name': 'test.txt',
+            'file_size': 100,
+            'vector_dimension': 768,
+            'upload_time_ms': 12.5,
+            's3_key': 'files/abc-123/test.txt'
+        }
+
+        validated = UploadResponse(**payload)
+        constructed = UploadResponse.model_construct(**payload)
+
+        self.assertEqual(validated.model_dump(), constructed.model_dump())
+
+    def test_file_response_round_trip(self):
+        """model_construct should produce the same payload as validated init"""
+        payload = {
+            'file_id': 'abc-123',
+            'file_name': 'test.txt',
+            'file_size': 100,
+            'content_type': 'text/plain',
+            'metadata': {'category': 'sample'},
+            'vector_dimension': 768,
+            'uploaded_at': '2023-01-01T00:00:00',
+            's3_key': 'files/abc-123/test.txt'
+        }
+
+        validated = FileResponse(**payload)
+        constructed = FileResponse.model_construct(**payload)
+
+        self.assertEqual(
+            validated.model_dump(mode='json'),
+            constructed.model_dump(mode='json')
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
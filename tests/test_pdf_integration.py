@@ -3,10 +3,11 @@ import requests
 import json
 import time
 import os
-from dotenv import load_dotenv
+from app.config import _load_dotenv
 
 # Load environment variables
-load_dotenv()
+if os.path.exists('.env'):
+    _load_dotenv('.env')
 
 
 class TestPDFIntegration(unittest.TestCase):
@@ -2,32 +2,37 @@ import unittest
 import tempfile
 import os
 import json
+import numpy as np
 from unittest.mock import Mock, patch, MagicMock
 from datetime import datetime
-from dotenv import load_dotenv
-
-# Load environment variables from .env file
-load_dotenv()
 
+from app.config import reset_config
 from app.services.s3vector_service import S3VectorService
 from app.services.embedding_service import EmbeddingService
 
 
 class TestEmbeddingService(unittest.TestCase):
     """Test cases for the EmbeddingService"""
-    
+
     def setUp(self):
         """Set up test fixtures"""
+        # The global config is memoized; drop any instance cached by other
+        # tests so this class never builds on their environment
+        reset_config()
         self.embedding_service = EmbeddingService()
-    
+
+    def tearDown(self):
+        """Clean up test fixtures"""
+        reset_config()
+
     def test_generate_text_embedding(self):
         """Test text embedding generation"""
         text = "This is a test document"
         embedding = self.embedding_service.generate_text_embedding(text)
-        
-        self.assertIsInstance(embedding, list)
+
+        self.assertIsInstance(embedding, np.ndarray)
+        self.assertEqual(embedding.dtype, np.float32)
         self.assertGreater(len(embedding), 0)
-        self.assertIsInstance(embedding[0], float)
     
     def test_get_embedding_dimension(self):
         """Test getting embedding dimension"""
@@ -54,7 +59,7 @@ class TestEmbeddingService(unittest.TestCase):
         
         try:
             embedding = self.embedding_service.generate_file_embedding(file_path)
-            self.assertIsInstance(embedding, list)
+            self.assertIsInstance(embedding, np.ndarray)
             self.assertGreater(len(embedding), 0)
         finally:
             os.unlink(file_path)
@@ -65,6 +70,10 @@ class TestS3VectorService(unittest.TestCase):
     
     def setUp(self):
         """Set up test fixtures"""
+        # Drop any memoized config so the patched environment below is
+        # actually read instead of a config cached by earlier tests
+        reset_config()
+
         # Mock environment variables
         self.env_patcher = patch.dict(os.environ, {
             'S3_VECTOR_BUCKET_NAME': 'test-bucket',
@@ -109,7 +118,34 @@ class TestS3VectorService(unittest.TestCase):
             ]
         }
         self.s3vectors_client_mock.put_vectors.return_value = {}
-        
+        self.s3vectors_client_mock.get_vectors.return_value = {
+            'vectors': [
+                {
+                    'key': 'test-id',
+                    'metadata': {
+                        'file_name': 'test.txt',
+                        'file_size': '100',
+                        'content_type': 'text/plain',
+                        'uploaded_at': '2023-01-01T00:00:00'
+                    }
+                }
+            ]
+        }
+        self.s3vectors_client_mock.list_vectors.return_value = {
+            'vectors': [
+                {
+                    'key': 'test-id',
+                    'metadata': {
+                        'file_name': 'test.txt',
+                        'file_size': '100',
+                        'content_type': 'text/plain',
+                        'uploaded_at': '2023-01-01T00:00:00'
+                    }
+                }
+            ]
+        }
+        self.s3vectors_client_mock.delete_vectors.return_value = {}
+
         # Set up mock responses for regular S3
         self.s3_client_mock.upload_file.return_value = None
         self.s3_client_mock.delete_object.return_value = {}
@@ -124,6 +160,7 @@ class TestS3VectorService(unittest.TestCase):
         self.env_patcher.stop()
         self.boto3_patcher.stop()
         self.embedding_patcher.stop()
+        reset_config()
     
     def test_init_success(self):
         """Test successful service initialization"""
@@ -183,51 +220,20 @@ class TestS3VectorService(unittest.TestCase):
         
         files = service.list_files(limit=10)
         self.assertIsInstance(files, list)
-        
+
         # Verify S3 Vectors API was called correctly
-        self.s3vectors_client_mock.query_vectors.assert_called()
+        self.s3vectors_client_mock.list_vectors.assert_called()
     
     def test_get_file_info(self):
         """Test getting file information"""
         service = S3VectorService()
-        
-        # Mock S3 list_objects_v2 response for file
-        self.s3_client_mock.list_objects_v2.return_value = {
-            'Contents': [
-                {'Key': 'files/test-id/test.txt'}
-            ]
-        }
-        
-        # Mock head_object response
-        mock_metadata = {
-            'file_name': 'test.txt',
-            'file_size': '100',
-            'content_type': 'text/plain',
-            'uploaded_at': datetime.utcnow().isoformat()
-        }
-        
-        self.s3_client_mock.head_object.return_value = {
-            'Metadata': mock_metadata,
-            'ContentType': 'text/plain',
-            'LastModified': datetime.utcnow()
-        }
-        
-        # Mock get_object response for vector data
-        mock_vector_data = {
-            'file_id': 'test-id',
-            'embedding': [0.1, 0.2, 0.3],
-            'dimension': 3,
-            'model': 'test-model'
-        }
-        
-        self.s3_client_mock.get_object.return_value = {
-            'Body': Mock(read=lambda: json.dumps(mock_vector_data).encode())
-        }
-        
+
+        # Served by the native get_vectors point lookup mocked in setUp
         file_info = service.get_file_info('test-id')
         self.assertIsInstance(file_info, dict)
         self.assertIn('file_id', file_info)
         self.assertIn('file_metadata', file_info)
+        self.s3vectors_client_mock.get_vectors.assert_called_once()
     
     def test_delete_file(self):
         """Test file deletion"""